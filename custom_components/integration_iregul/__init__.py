@@ -3,23 +3,39 @@
 from __future__ import annotations
 
 import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
-from .coordinator import CannotConnect, InvalidAuth, IRegulCoordinator
+from .const import CONF_DEVICE_ID, DOMAIN
+from .coordinator import CannotConnect, InvalidAuth, IRegulCoordinator, async_frame_store
+from .discovery import registry_frame
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the IRegul services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up IRegul from a config entry."""
-    coordinator = IRegulCoordinator(hass, entry.data)
+    coordinator = IRegulCoordinator(hass, entry.data, config_entry=entry)
+    if coordinator.deferred_setup:
+        return await _async_setup_entry_deferred(hass, entry, coordinator)
+
     try:
         await coordinator.async_setup()
     except InvalidAuth as err:
@@ -27,18 +43,78 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except CannotConnect as err:
         raise ConfigEntryNotReady from err
 
-    await coordinator.async_config_entry_first_refresh()
+    restored = await coordinator.async_restore_frame()
+    if restored:
+        # Entities start from the saved frame while live data is fetched in the background
+        entry.async_create_background_task(
+            hass, _async_first_refresh(coordinator), f"{DOMAIN} {entry.title} first refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    if not restored:
+        coordinator.async_start_streaming()
+    _async_setup_finished(entry, coordinator)
     return True
 
 
+async def _async_setup_entry_deferred(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: IRegulCoordinator
+) -> bool:
+    """Forward the platforms at once and reach the device in the background.
+
+    Entities start from the saved frame, or from placeholders of the entities
+    already registered, so setup never waits for the network.
+    """
+    if not await coordinator.async_restore_frame():
+        coordinator.async_set_placeholder_frame(registry_frame(hass, entry))
+
+    entry.runtime_data = coordinator
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_create_background_task(
+        hass, _async_connect(coordinator), f"{DOMAIN} {entry.title} deferred setup"
+    )
+    _async_setup_finished(entry, coordinator)
+    return True
+
+
+async def _async_connect(coordinator: IRegulCoordinator) -> None:
+    """Set up the client of a deferred entry and fetch its first frame.
+
+    Failures are those of any refresh: the entities stay unavailable and the
+    next scheduled refresh tries again.
+    """
+    await coordinator.async_setup()
+    await _async_first_refresh(coordinator)
+
+
+async def _async_first_refresh(coordinator: IRegulCoordinator) -> None:
+    """Fetch the first live frame, then open the stream so it never races the fetch."""
+    await coordinator.async_refresh()
+    coordinator.async_start_streaming()
+
+
+@callback
+def _async_setup_finished(entry: ConfigEntry, coordinator: IRegulCoordinator) -> None:
+    """Record how long setting up the entry took."""
+    coordinator.setup_seconds = time.perf_counter() - coordinator.setup_started
+    _LOGGER.debug("Set up %s in %.3f seconds", entry.title, coordinator.setup_seconds)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the frame saved for a deleted config entry."""
+    await async_frame_store(hass, entry.data[CONF_DEVICE_ID]).async_remove()
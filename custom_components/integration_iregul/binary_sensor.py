@@ -5,10 +5,12 @@ from __future__ import annotations
 from aioiregul.models import AnalogSensor, Input, Output
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import IRegulCoordinator
+from .discovery import DiscoveredItems
 from .entity import IRegulEntity
 
 
@@ -19,71 +21,34 @@ async def async_setup_entry(
 
     coordinator: IRegulCoordinator = entry.runtime_data
 
-    known_input_ids: set[int] = set()
-    known_output_ids: set[int] = set()
-    known_analog_ids: set[int] = set()
-
     @callback
-    def _async_add_new_entities() -> None:
+    def _async_add_new_entities(items: DiscoveredItems) -> None:
         """Add new binary sensors for inputs, outputs, and analog sensors of type 1."""
-
         new_entities: list[
             IRegulInputBinarySensor | IRegulOutputBinarySensor | IRegulAnalogBinarySensor
-        ] = []
-
-        # Inputs: type == 1
-        for input_id, input_sensor in coordinator.data.inputs.items():
-            if input_id in known_input_ids:
-                continue
-            if input_sensor.type != 1:
-                continue
-
-            known_input_ids.add(input_id)
-            new_entities.append(
-                IRegulInputBinarySensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    input_sensor=input_sensor,
-                )
-            )
-
-        # Outputs: type == 1
-        for output_id, output_sensor in coordinator.data.outputs.items():
-            if output_id in known_output_ids:
-                continue
-            if output_sensor.type != 1:
-                continue
-
-            known_output_ids.add(output_id)
-            new_entities.append(
-                IRegulOutputBinarySensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    output_sensor=output_sensor,
-                )
+        ] = [
+            IRegulInputBinarySensor(coordinator=coordinator, entry=entry, input_sensor=input_sensor)
+            for input_sensor in items.inputs
+        ]
+        new_entities.extend(
+            IRegulOutputBinarySensor(
+                coordinator=coordinator, entry=entry, output_sensor=output_sensor
             )
-
-        # Analog sensors: type == "1"
-        for analog_id, analog_sensor in coordinator.data.analog_sensors.items():
-            if analog_id in known_analog_ids:
-                continue
-            if analog_sensor.type != "1":
-                continue
-
-            known_analog_ids.add(analog_id)
-            new_entities.append(
-                IRegulAnalogBinarySensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    analog_sensor=analog_sensor,
-                )
+            for output_sensor in items.outputs
+        )
+        new_entities.extend(
+            IRegulAnalogBinarySensor(
+                coordinator=coordinator, entry=entry, analog_sensor=analog_sensor
             )
+            for analog_sensor in items.analog_sensors
+        )
 
         if new_entities:
             async_add_entities(new_entities)
 
-    _async_add_new_entities()
-    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_entities))
+    entry.async_on_unload(
+        coordinator.discovery.async_add_platform(Platform.BINARY_SENSOR, _async_add_new_entities)
+    )
 
 
 class IRegulBinarySensor(IRegulEntity, BinarySensorEntity):
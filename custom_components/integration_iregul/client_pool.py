@@ -0,0 +1,258 @@
+"""Shared API clients and per-host connection limits for IRegul devices."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from aiohttp import ClientSession, ClientTimeout
+from aioiregul.iregulapi import IRegulApiInterface
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    API_VERSION_V1,
+    DOMAIN,
+    HOST_FAILURE_THRESHOLD,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    SINGLE_FLIGHT_MIN_GAP,
+)
+from .polling import RetryPolicy
+from .singleflight import SingleFlightClient
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CLIENT_POOL: HassKey[IRegulClientPool] = HassKey(f"{DOMAIN}_client_pool")
+
+# Seconds an unused client is kept, so the entry set up after a config flow or
+# a reload reuses the client that was just authenticated
+CLIENT_LINGER_SECONDS = 120
+
+ClientFactory = Callable[[ClientSession | None], IRegulApiInterface]
+
+
+class ClientKey(NamedTuple):
+    """Identify a client by API version, host, credentials and timeout.
+
+    The timeout bounds each network phase of the client, so a client built with
+    another timeout is never handed out in its place.
+    """
+
+    api_version: str
+    host: str | None
+    device_id: str
+    password: str
+    timeout: float | None = None
+
+
+@dataclass(slots=True)
+class _PooledClient:
+    """Pooled client with the session it owns and its number of users."""
+
+    client: SingleFlightClient
+    session: ClientSession | None
+    users: int = 0
+    cancel_close: CALLBACK_TYPE | None = None
+
+
+class HostLimit:
+    """Bound the concurrent connections to a host, with a limit that can change.
+
+    Every user of a host keeps the same HostLimit, so a new limit applies to
+    all of them at once. Lowering the limit while connections are open takes
+    back the freed slots until the new limit is reached.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the limit."""
+        self._limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+        self._active = 0
+        # Slots to take back after the limit was lowered
+        self._excess = 0
+
+    @property
+    def limit(self) -> int:
+        """Return the number of concurrent connections allowed."""
+        return self._limit
+
+    @callback
+    def async_set_limit(self, limit: int) -> None:
+        """Change the number of concurrent connections allowed."""
+        delta = limit - self._limit
+        self._limit = limit
+        if delta < 0:
+            self._excess -= delta
+            return
+        taken_back = min(delta, self._excess)
+        self._excess -= taken_back
+        for _ in range(delta - taken_back):
+            self._semaphore.release()
+
+    def locked(self) -> bool:
+        """Return True when no connection slot is free."""
+        return self._active >= self._limit or self._semaphore.locked()
+
+    async def __aenter__(self) -> None:
+        """Wait for a free connection slot."""
+        # Free slots beyond a lowered limit are taken back first
+        while self._excess > 0 and not self._semaphore.locked():
+            await self._semaphore.acquire()
+            self._excess -= 1
+        await self._semaphore.acquire()
+        self._active += 1
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Free the connection slot, unless it exceeds a lowered limit."""
+        self._active -= 1
+        if self._excess > 0:
+            self._excess -= 1
+        else:
+            self._semaphore.release()
+
+
+class IRegulClientPool:
+    """Keep one long-lived client per device and limit connections per host.
+
+    Clients are shared by every user of the same key, so a device keeps its
+    client (and the v2 configuration skeleton enabling light 501 fetches)
+    across refreshes and reloads, and concurrent users share in-flight calls.
+    Released clients linger for a short while so a client validated by the
+    config flow is handed to the coordinator instead of authenticating again.
+    v1 clients get a dedicated session, since each device authenticates
+    through its own cookie jar, while the TCP connections are pooled by the
+    Home Assistant connector shared between sessions.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the pool."""
+        self.hass = hass
+        self._clients: dict[ClientKey, _PooledClient] = {}
+        self._host_limits: dict[tuple[str, str | None], HostLimit] = {}
+        self._host_policies: dict[tuple[str, str | None], RetryPolicy] = {}
+
+    @callback
+    def async_acquire(self, key: ClientKey, factory: ClientFactory) -> IRegulApiInterface:
+        """Return the client for the key, creating it on first use.
+
+        The key timeout bounds connecting and reading on the session created for v1 clients.
+        """
+        pooled = self._clients.get(key)
+        if pooled is None:
+            session: ClientSession | None = None
+            if key.api_version == API_VERSION_V1:
+                session_kwargs: dict[str, Any] = {}
+                if key.timeout is not None:
+                    session_kwargs["timeout"] = ClientTimeout(
+                        sock_connect=key.timeout, sock_read=key.timeout
+                    )
+                session = async_create_clientsession(
+                    self.hass, auto_cleanup=False, **session_kwargs
+                )
+            pooled = self._clients[key] = _PooledClient(
+                SingleFlightClient(factory(session), min_gap=SINGLE_FLIGHT_MIN_GAP), session
+            )
+        elif pooled.cancel_close is not None:
+            _LOGGER.debug("Reusing lingering client for device %s", key.device_id)
+            pooled.cancel_close()
+            pooled.cancel_close = None
+        pooled.users += 1
+        return pooled.client
+
+    async def async_release(self, key: ClientKey, *, linger: bool = True) -> None:
+        """Release a client once its last user is gone.
+
+        With linger, the client is kept for CLIENT_LINGER_SECONDS before being
+        closed; otherwise it is closed right away.
+        """
+        pooled = self._clients.get(key)
+        if pooled is None:
+            return
+        pooled.users -= 1
+        if pooled.users > 0:
+            return
+        if not linger:
+            await self._async_close(key)
+            return
+
+        @callback
+        def _async_close_unused(_now: object) -> None:
+            pooled.cancel_close = None
+            self.hass.async_create_task(self._async_close(key), eager_start=True)
+
+        pooled.cancel_close = async_call_later(
+            self.hass,
+            CLIENT_LINGER_SECONDS,
+            HassJob(_async_close_unused, cancel_on_shutdown=True),
+        )
+
+    async def _async_close(self, key: ClientKey) -> None:
+        """Close a client that has no users."""
+        pooled = self._clients.get(key)
+        if pooled is None or pooled.users > 0:
+            return
+        del self._clients[key]
+        if pooled.cancel_close is not None:
+            pooled.cancel_close()
+        if pooled.session is not None:
+            await pooled.session.close()
+
+    async def async_close_all(self, _event: Event | None = None) -> None:
+        """Close every pooled client session."""
+        clients, self._clients = self._clients, {}
+        for pooled in clients.values():
+            if pooled.cancel_close is not None:
+                pooled.cancel_close()
+            if pooled.session is not None:
+                await pooled.session.close()
+
+    @callback
+    def async_host_limit(self, api_version: str, host: str | None, limit: int) -> HostLimit:
+        """Return the limit bounding concurrent connections to a host.
+
+        The limit of the last caller for a host applies to every user of the host.
+        """
+        host_key = (api_version, host)
+        host_limit = self._host_limits.get(host_key)
+        if host_limit is None:
+            _LOGGER.debug("Limiting %s connections to %s to %s", api_version, host, limit)
+            host_limit = self._host_limits[host_key] = HostLimit(limit)
+        elif host_limit.limit != limit:
+            _LOGGER.debug(
+                "Changing the limit of %s connections to %s from %s to %s",
+                api_version,
+                host,
+                host_limit.limit,
+                limit,
+            )
+            host_limit.async_set_limit(limit)
+        return host_limit
+
+    @callback
+    def async_host_retry_policy(self, api_version: str, host: str | None) -> RetryPolicy:
+        """Return the retry policy shared by every device using a host."""
+        host_key = (api_version, host)
+        policy = self._host_policies.get(host_key)
+        if policy is None:
+            policy = self._host_policies[host_key] = RetryPolicy(
+                base_delay=RETRY_BASE_DELAY,
+                max_delay=RETRY_MAX_DELAY,
+                failure_threshold=HOST_FAILURE_THRESHOLD,
+            )
+        return policy
+
+
+@callback
+def async_get_client_pool(hass: HomeAssistant) -> IRegulClientPool:
+    """Return the client pool shared by all IRegul config entries."""
+    if (pool := hass.data.get(DATA_CLIENT_POOL)) is None:
+        pool = hass.data[DATA_CLIENT_POOL] = IRegulClientPool(hass)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, pool.async_close_all)
+    return pool
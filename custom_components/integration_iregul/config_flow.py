@@ -10,16 +10,41 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD
 from homeassistant.core import HomeAssistant, callback
 
+from .client_pool import ClientKey, async_get_client_pool
 from .const import (
     API_VERSION_V1,
     API_VERSION_V2,
+    CONF_ADAPTIVE_MAX_INTERVAL,
+    CONF_ADAPTIVE_MIN_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
     CONF_API_VERSION,
+    CONF_DEFERRED_SETUP,
     CONF_DEVICE_ID,
     CONF_DEVICE_PASSWORD,
+    CONF_FETCH_TIMEOUT,
+    CONF_HEDGE_REQUESTS,
     CONF_HOST,
+    CONF_MAX_CONNECTIONS_PER_HOST,
+    CONF_PHASE_TIMEOUT,
+    CONF_RACE_CLOUD,
+    CONF_RECORD_FRAMES,
     CONF_SERIAL_NUMBER,
+    CONF_STALE_INTERVALS,
+    CONF_STREAMING,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_ADAPTIVE_MAX_INTERVAL,
+    DEFAULT_ADAPTIVE_MIN_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
     DEFAULT_API_VERSION,
+    DEFAULT_DEFERRED_SETUP,
+    DEFAULT_FETCH_TIMEOUT,
+    DEFAULT_HEDGE_REQUESTS,
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_PHASE_TIMEOUT,
+    DEFAULT_RACE_CLOUD,
+    DEFAULT_RECORD_FRAMES,
+    DEFAULT_STALE_INTERVALS,
+    DEFAULT_STREAMING,
     DEFAULT_UPDATE_INTERVAL_V1,
     DEFAULT_UPDATE_INTERVAL_V2,
     DOMAIN,
@@ -39,6 +64,56 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+# Tuning options stored in entry data: key -> (default, validator)
+_TUNING_OPTIONS: dict[str, tuple[Any, Any]] = {
+    CONF_STALE_INTERVALS: (
+        DEFAULT_STALE_INTERVALS,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    ),
+    CONF_ADAPTIVE_POLLING: (DEFAULT_ADAPTIVE_POLLING, bool),
+    CONF_ADAPTIVE_MIN_INTERVAL: (
+        DEFAULT_ADAPTIVE_MIN_INTERVAL,
+        vol.All(vol.Coerce(int), vol.Range(min=10, max=86400)),
+    ),
+    CONF_ADAPTIVE_MAX_INTERVAL: (
+        DEFAULT_ADAPTIVE_MAX_INTERVAL,
+        vol.All(vol.Coerce(int), vol.Range(min=10, max=86400)),
+    ),
+    CONF_PHASE_TIMEOUT: (
+        DEFAULT_PHASE_TIMEOUT,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+    ),
+    CONF_FETCH_TIMEOUT: (
+        DEFAULT_FETCH_TIMEOUT,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=600)),
+    ),
+    CONF_RECORD_FRAMES: (DEFAULT_RECORD_FRAMES, bool),
+    CONF_STREAMING: (DEFAULT_STREAMING, bool),
+    CONF_RACE_CLOUD: (DEFAULT_RACE_CLOUD, bool),
+    CONF_HEDGE_REQUESTS: (DEFAULT_HEDGE_REQUESTS, bool),
+    CONF_DEFERRED_SETUP: (DEFAULT_DEFERRED_SETUP, bool),
+    CONF_MAX_CONNECTIONS_PER_HOST: (
+        DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+    ),
+}
+
+
+def _races_with_stream_or_hedge(tuning: dict[str, Any]) -> bool:
+    """Return True when racing the cloud is combined with streaming or hedging.
+
+    Racing paths apply the limit and retry policy of their own host, so the
+    coordinator has none to stream or hedge with.
+    """
+    return bool(
+        tuning.get(CONF_RACE_CLOUD, DEFAULT_RACE_CLOUD)
+        and (
+            tuning.get(CONF_STREAMING, DEFAULT_STREAMING)
+            or tuning.get(CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS)
+        )
+    )
+
+
 def _get_host_defaults(
     saved_host: str | None, user_input: dict[str, Any] | None
 ) -> tuple[bool, str]:
@@ -65,31 +140,69 @@ def _credentials_schema(
     )
 
 
+def _options_schema(
+    password: str,
+    interval: int,
+    use_custom_host: bool,
+    host: str,
+    tuning: dict[str, Any],
+) -> vol.Schema:
+    """Build the options schema."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_PASSWORD, default=password): str,
+            vol.Required(CONF_UPDATE_INTERVAL, default=interval): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=1440)
+            ),
+            vol.Required(CONF_USE_CUSTOM_HOST, default=use_custom_host): bool,
+            vol.Optional(CONF_HOST, default=host): str,
+            **{
+                vol.Optional(key, default=tuning.get(key, default)): validator
+                for key, (default, validator) in _TUNING_OPTIONS.items()
+            },
+        }
+    )
+
+
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input by testing connection to device."""
     device_id = data.get(CONF_DEVICE_ID) or data.get(CONF_SERIAL_NUMBER)
     password = data.get(CONF_DEVICE_PASSWORD)
     api_version = data.get(CONF_API_VERSION, DEFAULT_API_VERSION)
     host = data.get(CONF_HOST)
+    # Same timeout as the coordinator, whose pooled client must be this one
+    timeout = data.get(CONF_PHASE_TIMEOUT, DEFAULT_PHASE_TIMEOUT)
 
     if not device_id or not password:
         raise InvalidAuth
 
-    # Test the connection by creating client and fetching data
+    # Test the connection with a pooled client, so the coordinator set up
+    # right after the flow reuses it instead of authenticating again
+    pool = async_get_client_pool(hass)
+    key = ClientKey(api_version, host, device_id, password, timeout)
     try:
-        client = IRegulCoordinator.create_client(
-            hass,
-            device_id,
-            password,
-            api_version,
-            host,
+        client = pool.async_acquire(
+            key,
+            lambda session: IRegulCoordinator.create_client(
+                hass,
+                device_id,
+                password,
+                api_version,
+                host,
+                http_session=session,
+                timeout=timeout,
+            ),
         )
         # Test the connection by fetching data
-        await client.check_auth()
+        authenticated = await client.check_auth()
     except Exception as err:
+        await pool.async_release(key, linger=False)
         _LOGGER.error("Failed to validate credentials: %s", err)
         raise CannotConnect from err
 
+    # Only keep the client around when it may be reused
+    await pool.async_release(key, linger=authenticated is not False)
+
     return {"title": "IRegul"}
 
 
@@ -206,33 +319,43 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         current_interval = self.config_entry.data.get(CONF_UPDATE_INTERVAL, default_interval)
         saved_host = self.config_entry.data.get(CONF_HOST)
         use_custom_host, current_host = _get_host_defaults(saved_host, user_input)
+        current_tuning = {
+            key: self.config_entry.data[key]
+            for key in _TUNING_OPTIONS
+            if key in self.config_entry.data
+        }
 
         if user_input is not None:
             current_password = user_input[CONF_PASSWORD]
             current_interval = user_input[CONF_UPDATE_INTERVAL]
             current_host = user_input.get(CONF_HOST, current_host)
             normalized_host = current_host.strip()
+            tuning = {key: user_input[key] for key in _TUNING_OPTIONS if key in user_input}
+            current_tuning.update(tuning)
 
+            error = None
             if use_custom_host and not normalized_host:
+                error = "host_required"
+            elif use_custom_host and _races_with_stream_or_hedge(current_tuning):
+                error = "race_cloud_exclusive"
+            if error is not None:
                 return self.async_show_form(
                     step_id="init",
-                    data_schema=vol.Schema(
-                        {
-                            vol.Required(CONF_PASSWORD, default=current_password): str,
-                            vol.Required(CONF_UPDATE_INTERVAL, default=current_interval): vol.All(
-                                vol.Coerce(int), vol.Range(min=1, max=1440)
-                            ),
-                            vol.Required(CONF_USE_CUSTOM_HOST, default=use_custom_host): bool,
-                            vol.Optional(CONF_HOST, default=current_host): str,
-                        }
+                    data_schema=_options_schema(
+                        current_password,
+                        current_interval,
+                        use_custom_host,
+                        current_host,
+                        current_tuning,
                     ),
-                    errors={"base": "host_required"},
+                    errors={"base": error},
                 )
 
             new_data = {
                 **self.config_entry.data,
                 CONF_DEVICE_PASSWORD: user_input[CONF_PASSWORD],
                 CONF_UPDATE_INTERVAL: user_input[CONF_UPDATE_INTERVAL],
+                **tuning,
             }
             if use_custom_host:
                 new_data[CONF_HOST] = normalized_host
@@ -246,20 +369,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_PASSWORD: user_input[CONF_PASSWORD],
                     CONF_UPDATE_INTERVAL: user_input[CONF_UPDATE_INTERVAL],
                     CONF_HOST: normalized_host if use_custom_host else None,
+                    **tuning,
                 },
             )
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_PASSWORD, default=current_password): str,
-                    vol.Required(CONF_UPDATE_INTERVAL, default=current_interval): vol.All(
-                        vol.Coerce(int), vol.Range(min=1, max=1440)
-                    ),
-                    vol.Required(CONF_USE_CUSTOM_HOST, default=use_custom_host): bool,
-                    vol.Optional(CONF_HOST, default=current_host): str,
-                }
+            data_schema=_options_schema(
+                current_password,
+                current_interval,
+                use_custom_host,
+                current_host,
+                current_tuning,
             ),
         )
 
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
-from typing import TypedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple, TypedDict
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import (
@@ -48,6 +51,64 @@ CONF_UPDATE_INTERVAL = "upd_int"
 DEFAULT_UPDATE_INTERVAL = 15
 DEFAULT_UPDATE_INTERVAL_V1 = 15
 DEFAULT_UPDATE_INTERVAL_V2 = 5
+# Data becomes stale after this many update intervals without a new frame, plus a grace delay
+CONF_STALE_INTERVALS = "stale_intervals"
+DEFAULT_STALE_INTERVALS = 3
+STALE_GRACE_MINUTES = 1
+# Adaptive polling follows the device publish cadence within min/max bounds (seconds)
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_ADAPTIVE_MIN_INTERVAL = "adaptive_min_int"
+CONF_ADAPTIVE_MAX_INTERVAL = "adaptive_max_int"
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_ADAPTIVE_MIN_INTERVAL = 30
+DEFAULT_ADAPTIVE_MAX_INTERVAL = 900
+# Retry policy after failed fetches, in seconds: a device backs off from its own
+# polling interval up to the max delay; a host circuit opens for every device using
+# it after consecutive failures on that host and backs off from the base delay.
+RETRY_BASE_DELAY = 60
+RETRY_MAX_DELAY = 1800
+HOST_FAILURE_THRESHOLD = 3
+# Fetch timeout budget in seconds: each network phase (connect, then reading the
+# response) is bounded by the phase timeout, the whole fetch including decoding by the fetch one
+CONF_PHASE_TIMEOUT = "phase_timeout"
+CONF_FETCH_TIMEOUT = "fetch_timeout"
+DEFAULT_PHASE_TIMEOUT = 15
+DEFAULT_FETCH_TIMEOUT = 45
+# Append every received frame to a compressed file in the config directory for offline replay
+CONF_RECORD_FRAMES = "record_frames"
+DEFAULT_RECORD_FRAMES = False
+# v2 only: keep a connection open and receive frames as the device pushes them
+CONF_STREAMING = "streaming"
+DEFAULT_STREAMING = False
+# With a custom host, also query the default cloud endpoint and keep the first answer
+CONF_RACE_CLOUD = "race_cloud"
+DEFAULT_RACE_CLOUD = False
+# Races won net of failures by which a path must lead to be used alone, and how
+# often reads race every path again once a leader is used alone
+RACE_SETTLE_LEAD = 5
+RACE_PROBE_EVERY = 20
+# Hedged fetches: a fetch slower than the quantile of recent latencies gets one
+# duplicate request, for at most the budget share of the requests
+CONF_HEDGE_REQUESTS = "hedge_requests"
+DEFAULT_HEDGE_REQUESTS = False
+HEDGE_QUANTILE = 0.95
+HEDGE_BUDGET_RATIO = 0.1
+HEDGE_MIN_SAMPLES = 20
+# Forward the platforms at once with entities recreated from the entity registry,
+# then create the client and fetch the first frame in the background
+CONF_DEFERRED_SETUP = "deferred_setup"
+DEFAULT_DEFERRED_SETUP = False
+# Last frame saved across restarts, written at most once per save delay (seconds)
+FRAME_STORAGE_VERSION = 1
+FRAME_SAVE_DELAY = 60
+# State attribute set to true while an entity shows the frame saved before the last
+# restart; HA's own "restored" attribute marks entities that are no longer provided
+ATTR_FROM_SAVED_FRAME = "from_saved_frame"
+# Seconds during which a fetched frame is shared with later callers instead of fetching again
+SINGLE_FLIGHT_MIN_GAP = 2.0
+# Concurrent connections allowed to a single host, shared by all entries targeting it
+CONF_MAX_CONNECTIONS_PER_HOST = "max_conn_per_host"
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 4
 
 LOGGER = logging.getLogger(__package__)
 
@@ -346,6 +407,59 @@ UNIT_MAP: dict[str, UnitInfo] = {
 }
 
 
+class ResolvedUnit(NamedTuple):
+    """Unit metadata resolved ahead of time for a raw unit string.
+
+    Fields:
+    - config: device class, state class and display unit (see get_unit_config)
+    - canonical: canonical unit and factor for aggregation (see canonicalize_unit)
+    """
+
+    config: tuple[SensorDeviceClass | None, SensorStateClass | None, str | None]
+    canonical: tuple[str | None, float]
+
+
+# Maximum number of unknown unit strings kept in the resolution cache
+UNKNOWN_UNIT_CACHE_SIZE = 128
+
+_NONE_UNIT = ResolvedUnit(DEFAULT_UNIT_CONFIG, (None, 1.0))
+
+
+def _compile_unit(unit: str, info: UnitInfo) -> ResolvedUnit:
+    """Resolve a UNIT_MAP entry into its final tuples."""
+    canonical = info.get("canonical_unit")
+    return ResolvedUnit(
+        (
+            info.get("device_class"),
+            info.get("state_class", SensorStateClass.MEASUREMENT),
+            info.get("native_unit"),
+        ),
+        (unit, 1.0) if canonical is None else (canonical, info.get("factor", 1.0)),
+    )
+
+
+# UNIT_MAP compiled once at import: original unit -> ResolvedUnit
+RESOLVED_UNITS: Mapping[str, ResolvedUnit] = MappingProxyType(
+    {unit: _compile_unit(unit, info) for unit, info in UNIT_MAP.items()}
+)
+
+
+@lru_cache(maxsize=UNKNOWN_UNIT_CACHE_SIZE)
+def _resolve_unknown_unit(unit: str) -> ResolvedUnit:
+    """Resolve a unit string missing from UNIT_MAP."""
+    return ResolvedUnit(DEFAULT_UNIT_CONFIG, (unit, 1.0))
+
+
+def resolve_unit(unit: str | None) -> ResolvedUnit:
+    """Return the resolved metadata for a raw unit string."""
+    if unit is None:
+        return _NONE_UNIT
+    resolved = RESOLVED_UNITS.get(unit)
+    if resolved is None:
+        return _resolve_unknown_unit(unit)
+    return resolved
+
+
 def get_unit_config(
     unit: str | None,
 ) -> tuple[SensorDeviceClass | None, SensorStateClass | None, str | None]:
@@ -353,16 +467,7 @@ def get_unit_config(
 
     Falls back to DEFAULT_UNIT_CONFIG when unit is None or unknown.
     """
-    if unit is None:
-        return DEFAULT_UNIT_CONFIG
-    info = UNIT_MAP.get(unit)
-    if info is None:
-        return DEFAULT_UNIT_CONFIG
-    return (
-        info.get("device_class"),
-        info.get("state_class", SensorStateClass.MEASUREMENT),
-        info.get("native_unit"),
-    )
+    return resolve_unit(unit).config
 
 
 def canonicalize_unit(unit: str | None) -> tuple[str | None, float]:
@@ -370,13 +475,4 @@ def canonicalize_unit(unit: str | None) -> tuple[str | None, float]:
 
     If the unit isn't recognized or has no canonicalization, returns (unit, 1.0).
     """
-    if unit is None:
-        return None, 1.0
-    info = UNIT_MAP.get(unit)
-    if info is None:
-        return unit, 1.0
-    canonical = info.get("canonical_unit")
-    factor = info.get("factor", 1.0)
-    if canonical is None:
-        return unit, 1.0
-    return canonical, factor
+    return resolve_unit(unit).canonical
@@ -2,31 +2,87 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
+import time
 from datetime import datetime, timedelta
 from types import MappingProxyType
 from typing import Any
 
+from aiohttp import ClientSession
 from aioiregul.iregulapi import IRegulApiInterface
 from aioiregul.models import MappedFrame
 from aioiregul.v1 import Device
 from aioiregul.v2.client import IRegulClient
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.event import async_call_at, async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
+from .client_pool import ClientKey, HostLimit, async_get_client_pool
 from .const import (
     API_VERSION_V1,
     API_VERSION_V2,
+    CONF_ADAPTIVE_MAX_INTERVAL,
+    CONF_ADAPTIVE_MIN_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
     CONF_API_VERSION,
+    CONF_DEFERRED_SETUP,
     CONF_DEVICE_ID,
     CONF_DEVICE_PASSWORD,
+    CONF_FETCH_TIMEOUT,
+    CONF_HEDGE_REQUESTS,
     CONF_HOST,
+    CONF_MAX_CONNECTIONS_PER_HOST,
+    CONF_PHASE_TIMEOUT,
+    CONF_RACE_CLOUD,
+    CONF_RECORD_FRAMES,
+    CONF_STALE_INTERVALS,
+    CONF_STREAMING,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_ADAPTIVE_MAX_INTERVAL,
+    DEFAULT_ADAPTIVE_MIN_INTERVAL,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_DEFERRED_SETUP,
+    DEFAULT_FETCH_TIMEOUT,
+    DEFAULT_HEDGE_REQUESTS,
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_PHASE_TIMEOUT,
+    DEFAULT_RACE_CLOUD,
+    DEFAULT_RECORD_FRAMES,
+    DEFAULT_STALE_INTERVALS,
+    DEFAULT_STREAMING,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    FRAME_SAVE_DELAY,
+    FRAME_STORAGE_VERSION,
+    HEDGE_BUDGET_RATIO,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_QUANTILE,
+    RACE_PROBE_EVERY,
+    RACE_SETTLE_LEAD,
+    RETRY_MAX_DELAY,
+    STALE_GRACE_MINUTES,
 )
+from .discovery import (
+    FrameShape,
+    IRegulDiscovery,
+    MeasurementGroupKey,
+    build_measurement_groups,
+    frame_shape,
+)
+from .polling import CircuitState, FrameCadence, HedgePolicy, RetryPolicy
+from .profiler import RefreshProfiler
+from .racing import RacePath, RacingClient
+from .replay import FrameRecorder, frame_from_dict, frame_to_dict
+from .scheduler import async_get_scheduler
+from .singleflight import SingleFlightClient, unwrap_client
+from .stats import LatencyHistogram, RollingWindow
+from .streaming import STREAM_MIN_RECONNECT_SECONDS, FrameStream
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,6 +95,12 @@ class InvalidAuth(Exception):
     """Error to indicate there is invalid authentication."""
 
 
+@callback
+def async_frame_store(hass: HomeAssistant, device_id: str) -> Store[dict[str, Any]]:
+    """Return the store keeping the last frame of a device across restarts."""
+    return Store(hass, FRAME_STORAGE_VERSION, f"{DOMAIN}.frame_{device_id}")
+
+
 class IRegulCoordinator(DataUpdateCoordinator[MappedFrame]):
     """Coordinator for IRegul integration."""
 
@@ -46,21 +108,131 @@ class IRegulCoordinator(DataUpdateCoordinator[MappedFrame]):
         self,
         hass: HomeAssistant,
         data: MappingProxyType[str, Any],
+        config_entry: ConfigEntry | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             name=DOMAIN,
             update_interval=timedelta(
                 minutes=data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
             ),
+            # Listeners are only notified when the data object changes; a frame
+            # that did not advance keeps the current one (see _async_update_data)
+            always_update=False,
         )
         self.hass = hass
         self.data_config = data
         self.client: IRegulApiInterface | None = None
         self._api_version = data.get(CONF_API_VERSION, API_VERSION_V2)
+        self._client_pool = async_get_client_pool(hass)
+        self._client_keys: list[ClientKey] = []
+        self._host_limit: HostLimit | None = None
+        self._device_id: str = data[CONF_DEVICE_ID]
+        self._scheduler = async_get_scheduler(hass)
+        self._unregister_scheduler: CALLBACK_TYPE | None = None
+        self._refresh_job = HassJob(
+            self._async_handle_scheduled_refresh,
+            f"{DOMAIN} {self._device_id} refresh",
+            cancel_on_shutdown=True,
+        )
+        # Adaptive polling learns the device cadence instead of following the fleet schedule
+        self._cadence: FrameCadence | None = (
+            FrameCadence() if data.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING) else None
+        )
+        self._adaptive_min_interval: float = data.get(
+            CONF_ADAPTIVE_MIN_INTERVAL, DEFAULT_ADAPTIVE_MIN_INTERVAL
+        )
+        self._adaptive_max_interval: float = data.get(
+            CONF_ADAPTIVE_MAX_INTERVAL, DEFAULT_ADAPTIVE_MAX_INTERVAL
+        )
+        # Backoff after failed fetches, starting from the nominal polling interval
+        self._retry_policy = RetryPolicy(
+            base_delay=(
+                self._adaptive_max_interval
+                if self._cadence is not None
+                else self.update_interval.total_seconds()
+            ),
+            max_delay=RETRY_MAX_DELAY,
+        )
+        # Shared by every device on the same host, set up with the client
+        self._host_retry_policy: RetryPolicy | None = None
         self._last_update_success: datetime | None = None
+        # Staleness of the data, evaluated once per refresh for cheap availability checks
+        # and flipped by a timer when no new frame arrives in time
+        self.data_stale = False
+        self.stale_threshold = timedelta(
+            minutes=data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+            * data.get(CONF_STALE_INTERVALS, DEFAULT_STALE_INTERVALS)
+            + STALE_GRACE_MINUTES
+        )
+        self._stale_deadline: datetime | None = None
+        self._unsub_stale: CALLBACK_TYPE | None = None
+        self._stale_job = HassJob(
+            self._async_handle_stale, f"{DOMAIN} stale data", cancel_on_shutdown=True
+        )
+        # Timeout budget of a fetch, and the latency of the fetches that completed
+        self._phase_timeout: float = data.get(CONF_PHASE_TIMEOUT, DEFAULT_PHASE_TIMEOUT)
+        self._fetch_timeout: float = data.get(CONF_FETCH_TIMEOUT, DEFAULT_FETCH_TIMEOUT)
+        self.fetch_latency = LatencyHistogram()
+        # Duplicate requests sent for the slowest fetches, when enabled
+        self._hedge_policy: HedgePolicy | None = (
+            HedgePolicy(
+                quantile=HEDGE_QUANTILE,
+                budget_ratio=HEDGE_BUDGET_RATIO,
+                min_samples=HEDGE_MIN_SAMPLES,
+            )
+            if data.get(CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS)
+            else None
+        )
+        # Number of entity state writes skipped because nothing changed, and written
+        self.suppressed_writes = 0
+        self.state_writes = 0
+        # Successful polls, and those that returned a frame we already had
+        self.polls = 0
+        self.duplicate_frames = 0
+        # Recent samples backing the diagnostic performance sensors
+        self.recent_fetch_latency = RollingWindow()
+        self.recent_duplicates = RollingWindow()
+        self.recent_writes_per_update = RollingWindow()
+        self.recent_callback_time = RollingWindow()
+        # Set by the profile service while the next refresh cycles are profiled
+        self._profiler: RefreshProfiler | None = None
+        # Opt-in recording of every received frame, replayable with ReplayClient
+        self._recorder: FrameRecorder | None = (
+            FrameRecorder(hass.config.path(f"{DOMAIN}_frames_{self._device_id}.jsonl.gz"))
+            if data.get(CONF_RECORD_FRAMES, DEFAULT_RECORD_FRAMES)
+            else None
+        )
+        # v2 frames pushed over a long-lived connection instead of polled, once started
+        self._streaming: bool = self._api_version == API_VERSION_V2 and data.get(
+            CONF_STREAMING, DEFAULT_STREAMING
+        )
+        self._stream_task: asyncio.Task[None] | None = None
+        # Race the configured host against the cloud endpoint, keeping the fastest answer
+        self._race_cloud: bool = data.get(CONF_RACE_CLOUD, DEFAULT_RACE_CLOUD)
+        self.stream_connected = False
+        self.stream_connections = 0
+        # Set when the endpoint answered a stream request without pushing anything more
+        self.stream_fallback = False
+        self.pushed_frames = 0
+        # Last frame saved across restarts; data comes from it until a live frame arrives
+        self._frame_store = async_frame_store(hass, self._device_id)
+        self.restored = False
+        self._restored_unchanged = False
+        # Platforms forwarded before the client is set up, and how long setting up took
+        self.deferred_setup: bool = data.get(CONF_DEFERRED_SETUP, DEFAULT_DEFERRED_SETUP)
+        self.setup_started = time.perf_counter()
+        self.setup_seconds: float | None = None
+        self.first_frame_seconds: float | None = None
+        # Structure signature of the current frame; discovery only runs when it changes
+        self.frame_shape: FrameShape | None = None
+        # Measurement members per (alias, canonical unit), rebuilt when the shape changes
+        self.measurement_groups: dict[MeasurementGroupKey, list[tuple[int, float]]] = {}
+        # Single discovery pass per frame shared by the sensor and binary_sensor platforms
+        self.discovery = IRegulDiscovery(self)
 
     @staticmethod
     def create_client(
@@ -69,54 +241,608 @@ class IRegulCoordinator(DataUpdateCoordinator[MappedFrame]):
         password: str,
         api_version: str = API_VERSION_V2,
         host: str | None = None,
+        *,
+        http_session: ClientSession | None = None,
+        timeout: float | None = None,
     ) -> IRegulApiInterface:
-        """Create an API client based on the API version."""
+        """Create an API client based on the API version.
+
+        The HTTP session is only used by v1 clients; a new one is created when omitted.
+        The timeout bounds each socket operation of v2 clients; v1 clients follow the
+        timeout of their session.
+        """
         if api_version == API_VERSION_V1:
             return Device(
-                http_session=async_create_clientsession(hass),
+                http_session=http_session or async_create_clientsession(hass),
                 host=host,
                 device_id=device_id,
                 password=password,
             )
-        return IRegulClient(
-            host=host,
-            device_id=device_id,
-            password=password,
-        )
+        if timeout is None:
+            return IRegulClient(host=host, device_id=device_id, password=password)
+        return IRegulClient(host=host, device_id=device_id, password=password, timeout=timeout)
 
     async def async_setup(self) -> None:
-        """Set up the coordinator by initializing the API client."""
-        self.client = self.create_client(
-            self.hass,
+        """Set up the coordinator by acquiring the API client from the shared pool."""
+        host = self.data_config.get(CONF_HOST)
+        key = ClientKey(
+            self._api_version,
+            host,
             self.data_config[CONF_DEVICE_ID],
             self.data_config[CONF_DEVICE_PASSWORD],
+            self._phase_timeout,
+        )
+        self.client = self._async_acquire_client(key)
+        self._client_keys = [key]
+        if host and self._race_cloud:
+            # Query the default cloud endpoint along with the configured host; each
+            # path goes through the connection limit and retry policy of its own host
+            if self._streaming or self._hedge_policy is not None:
+                _LOGGER.warning(
+                    "Device %s races the cloud endpoint: streaming and hedging are disabled",
+                    self._device_id,
+                )
+            cloud_key = key._replace(host=None)
+            self._client_keys.append(cloud_key)
+            self.client = RacingClient(
+                [
+                    self._async_race_path("host", key, self.client),
+                    self._async_race_path(
+                        "cloud", cloud_key, self._async_acquire_client(cloud_key)
+                    ),
+                ],
+                settle_lead=RACE_SETTLE_LEAD,
+                probe_every=RACE_PROBE_EVERY,
+                clock=self.hass.loop.time,
+            )
+        else:
+            self._host_limit = self._async_host_limit(host)
+            self._host_retry_policy = self._client_pool.async_host_retry_policy(
+                self._api_version, host
+            )
+        if self.update_interval is not None and self._cadence is None:
+            self._unregister_scheduler = self._scheduler.async_register(
+                self._device_id, self.update_interval.total_seconds()
+            )
+
+    async def async_restore_frame(self) -> bool:
+        """Start from the frame saved before the last restart.
+
+        Returns False when no usable frame was saved. The restored frame is not
+        a fetch: it never makes the data stale and the first live frame always
+        replaces it.
+        """
+        stored = await self._frame_store.async_load()
+        if stored is None:
+            return False
+        try:
+            frame = frame_from_dict(stored)
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring saved frame of device %s: %s", self._device_id, err)
+            return False
+        self.data = frame
+        self.restored = True
+        self.frame_shape = frame_shape(frame)
+        self.measurement_groups = build_measurement_groups(frame.measurements)
+        return True
+
+    @callback
+    def async_set_placeholder_frame(self, frame: MappedFrame) -> None:
+        """Start from a frame listing the known items without their values.
+
+        Entities are created from it right away and stay unavailable, as with
+        stale data, until the first live frame arrives. Measurement groups are
+        left empty so the placeholders never create merged sensors; a live
+        frame of the same shape only holds items that already have their own
+        entity, so it has no merged sensor to create either.
+        """
+        self.data = frame
+        self.data_stale = True
+        self.frame_shape = frame_shape(frame)
+
+    @callback
+    def _async_host_limit(self, host: str | None) -> HostLimit:
+        """Return the connection limit shared by every device using a host."""
+        return self._client_pool.async_host_limit(
             self._api_version,
-            self.data_config.get(CONF_HOST),
+            host,
+            self.data_config.get(CONF_MAX_CONNECTIONS_PER_HOST, DEFAULT_MAX_CONNECTIONS_PER_HOST),
+        )
+
+    @callback
+    def _async_race_path(self, name: str, key: ClientKey, client: IRegulApiInterface) -> RacePath:
+        """Build a race path reaching the host of a key."""
+        return RacePath(
+            name,
+            client,
+            limit=self._async_host_limit(key.host),
+            retry_policy=self._client_pool.async_host_retry_policy(key.api_version, key.host),
+        )
+
+    @callback
+    def _async_acquire_client(self, key: ClientKey) -> IRegulApiInterface:
+        """Acquire the pooled client for a key."""
+        return self._client_pool.async_acquire(
+            key,
+            lambda session: self.create_client(
+                self.hass,
+                key.device_id,
+                key.password,
+                key.api_version,
+                key.host,
+                http_session=session,
+                timeout=key.timeout,
+            ),
         )
 
+    async def async_shutdown(self) -> None:
+        """Shut down the coordinator and release the pooled client."""
+        if self._stream_task is not None:
+            task, self._stream_task = self._stream_task, None
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await super().async_shutdown()
+        if self._unregister_scheduler is not None:
+            self._unregister_scheduler()
+            self._unregister_scheduler = None
+        if self._unsub_stale is not None:
+            self._unsub_stale()
+            self._unsub_stale = None
+        keys, self._client_keys = self._client_keys, []
+        self.client = None
+        for key in keys:
+            await self._client_pool.async_release(key)
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh, unless a stream receives the frames."""
+        if self._stream_task is not None:
+            return
+        if self._cadence is None and self._unregister_scheduler is None and not self._backing_off():
+            super()._schedule_refresh()
+            return
+        if self.config_entry and self.config_entry.pref_disable_polling:
+            return
+
+        self._async_unsub_refresh()
+        self._unsub_refresh = async_call_at(
+            self.hass, self._refresh_job, self._next_refresh_at(self.hass.loop.time())
+        )
+
+    def _next_refresh_at(self, now: float) -> float:
+        """Return the loop time of the next fetch.
+
+        After failures the fetch waits for the retry policies of the device
+        and its host. Otherwise, with adaptive polling the fetch happens just
+        after the next expected frame, or on this device's slot of the fleet
+        schedule.
+        """
+        if self._backing_off():
+            next_refresh = now
+            if self._retry_policy.state is not CircuitState.CLOSED:
+                next_refresh = self._retry_policy.open_until
+            host_policy = self._host_retry_policy
+            if host_policy is not None and host_policy.state is CircuitState.OPEN:
+                next_refresh = max(next_refresh, host_policy.open_until)
+            return next_refresh
+        if self._cadence is not None:
+            return now + self._cadence.next_delay(
+                dt_util.utcnow(), self._adaptive_min_interval, self._adaptive_max_interval
+            )
+        if self._unregister_scheduler is not None:
+            return self._scheduler.next_refresh(self._device_id, now)
+        return now + (self.update_interval or timedelta()).total_seconds()
+
+    def _backing_off(self) -> bool:
+        """Return True while the device or host retry policy delays fetches."""
+        host_policy = self._host_retry_policy
+        return self._retry_policy.state is not CircuitState.CLOSED or (
+            host_policy is not None and host_policy.state is CircuitState.OPEN
+        )
+
+    @callback
+    def _async_handle_scheduled_refresh(self, _now: datetime) -> None:
+        """Run a refresh scheduled by _schedule_refresh."""
+        name = f"{self.name} - {self._device_id} - refresh"
+        if self.config_entry:
+            self.config_entry.async_create_background_task(
+                self.hass, self._handle_refresh_interval(), name=name, eager_start=True
+            )
+        else:
+            self.hass.async_create_background_task(
+                self._handle_refresh_interval(), name=name, eager_start=True
+            )
+
     async def _async_update_data(self) -> MappedFrame:
         """Fetch data from the API."""
         if self.client is None:
             raise UpdateFailed("Client not initialized")
 
+        # Both unset when racing: every path applies the limit and policy of its host
+        host_policy = self._host_retry_policy
+        now = self.hass.loop.time()
+        self._check_retry_policies(host_policy, now)
+        self._scheduler.async_record_refresh(self._device_id, now)
+
         try:
-            data = await self.client.get_data()
+            async with self._host_limit or contextlib.nullcontext():
+                started = self.hass.loop.time()
+                # The library closes its connection when the fetch is cancelled
+                async with asyncio.timeout(self._fetch_timeout):
+                    data = await self._async_fetch(self.client)
+                latency = self.hass.loop.time() - started
+                self.fetch_latency.record(latency)
+                self.recent_fetch_latency.add(latency)
 
             if not data:
                 raise UpdateFailed("No data received from device")
+        except BaseException as err:
+            # Cancelled attempts count too, so a half-open circuit never waits forever
+            now = self.hass.loop.time()
+            self._retry_policy.record_failure(now)
+            if host_policy is not None:
+                host_policy.record_failure(now)
+            if not isinstance(err, Exception):
+                raise
+            if isinstance(err, TimeoutError):
+                self.fetch_latency.record_timeout()
+                raise UpdateFailed(f"Timeout fetching data: {err or 'budget exceeded'}") from err
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+        self._retry_policy.record_success()
+        if host_policy is not None:
+            host_policy.record_success()
+        return await self._async_process_frame(data)
+
+    async def _async_fetch(self, client: IRegulApiInterface) -> MappedFrame | None:
+        """Fetch a frame, hedging a slow request with a duplicate one."""
+        hedge = self._hedge_policy
+        # A racing client already covers slow requests, and its paths coalesce
+        # calls: a duplicate sent through them would only join the slow request
+        if (
+            hedge is None
+            or isinstance(client, RacingClient)
+            or (delay := hedge.delay(self.recent_fetch_latency)) is None
+        ):
+            return await client.get_data()
+
+        original = asyncio.create_task(client.get_data())
+        tasks = [original]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return original.result()
+            limit = self._host_limit
+            if limit is not None and limit.locked():
+                # Every connection slot of the host is taken: a duplicate would exceed the limit
+                return await original
+            hedge.record_hedge()
+            tasks.append(asyncio.create_task(self._async_hedge_request(client, limit)))
+            pending = set(tasks)
+            errors: list[BaseException] = []
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if (error := task.exception()) is not None:
+                        errors.append(error)
+                        continue
+                    if task is not original:
+                        hedge.record_win()
+                    return task.result()
+            raise errors[0]
+        finally:
+            # Cancelling the slower request closes its connection
+            for task in tasks:
+                task.cancel()
+            await asyncio.wait(tasks)
+            for task in tasks:
+                # A loser that failed before being cancelled must not log its error
+                if not task.cancelled():
+                    task.exception()
+
+    async def _async_hedge_request(
+        self, client: IRegulApiInterface, limit: HostLimit | None
+    ) -> MappedFrame | None:
+        """Send the duplicate of a slow fetch in a connection slot of its own.
+
+        The duplicate bypasses the single-flight layer on purpose: going through
+        it would join the slow request in flight instead of sending a new one.
+        """
+        async with limit or contextlib.nullcontext():
+            return await unwrap_client(client).get_data()
+
+    def _check_retry_policies(self, host_policy: RetryPolicy | None, now: float) -> None:
+        """Raise UpdateFailed when the device or host retry policy refuses a request."""
+        # Refused attempts send nothing, keeping outages cheap for the device and the loop.
+        # A host refusal is no failure of the device, so its backoff never outlasts the host
+        if host_policy is not None and host_policy.refuses(now):
+            raise UpdateFailed(
+                "Host is failing for every device, "
+                f"retrying in {max(host_policy.open_until - now, 0):.0f} seconds"
+            )
+        if not self._retry_policy.allow_request(now):
+            raise UpdateFailed(
+                f"Backing off after {self._retry_policy.failures} failed attempts, "
+                f"retrying in {self._retry_policy.open_until - now:.0f} seconds"
+            )
+        if host_policy is not None:
+            # Takes the probe of a host whose delay elapsed
+            host_policy.allow_request(now)
+
+    async def _async_process_frame(self, data: MappedFrame) -> MappedFrame:
+        """Account for a received frame and return the data to keep."""
+        if self._recorder is not None:
+            await self._async_record_frame(self._recorder, data)
+
+        try:
+            self.polls += 1
+            timestamp = dt_util.as_utc(data.timestamp)
+            if (
+                self.data is not None
+                and self._last_update_success is not None
+                and timestamp <= self._last_update_success
+            ):
+                # Same or older frame: keep the current data so no listener is notified
+                self.duplicate_frames += 1
+                self.recent_duplicates.add(1)
+                return self.data
 
-            self._last_update_success = dt_util.as_utc(data.timestamp)
+            self.recent_duplicates.add(0)
+            self._last_update_success = timestamp
+            if self.first_frame_seconds is None:
+                self.first_frame_seconds = time.perf_counter() - self.setup_started
+            if self._cadence is not None:
+                self._cadence.observe(timestamp)
+            shape = frame_shape(data)
+            if shape != self.frame_shape:
+                self.frame_shape = shape
+                self.measurement_groups = build_measurement_groups(data.measurements)
+            if self.restored:
+                self.restored = False
+                self._restored_unchanged = data == self.data
+            self._frame_store.async_delay_save(lambda: frame_to_dict(data), FRAME_SAVE_DELAY)
 
             return data
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-    def is_data_stale(self, stale_minutes: int = 16) -> bool:
+    @callback
+    def async_start_streaming(self) -> None:
+        """Receive v2 frames over a long-lived connection when streaming is enabled.
+
+        Called once the first refresh finished, so the stream never opens a
+        second connection alongside it; scheduled polling stops while the
+        stream runs, and so does a profile of the refresh cycles.
+        """
+        if (
+            not self._streaming
+            or self.stream_fallback
+            or self._stream_task is not None
+            or self.client is None
+        ):
+            return
+        client = unwrap_client(self.client)
+        if (
+            not isinstance(client, IRegulClient)
+            or self._host_limit is None
+            or self._host_retry_policy is None
+        ):
+            return
+        self._async_unsub_refresh()
+        if self._profiler is not None:
+            _LOGGER.warning("Profile of device %s ended: frames are now pushed", self._device_id)
+            self._profiler = None
+        name = f"{self.name} - {self._device_id} - stream"
+        stream = self._async_stream(client, self._host_limit, self._host_retry_policy)
+        if self.config_entry:
+            self._stream_task = self.config_entry.async_create_background_task(
+                self.hass, stream, name=name
+            )
+        else:
+            self._stream_task = self.hass.async_create_background_task(stream, name=name)
+
+    async def _async_stream(
+        self, client: IRegulClient, host_limit: HostLimit, host_policy: RetryPolicy
+    ) -> None:
+        """Push the frames received over a stream, reconnecting when it ends.
+
+        Failures back off through the retry policies. An endpoint that closes
+        the connection right after its answer does not push frames: streaming
+        stops and the device is polled with light 501 requests instead.
+        """
+        loop = self.hass.loop
+        # Without even a keepalive for that long, the connection is considered dead
+        idle_timeout = self.stale_threshold.total_seconds()
+        while True:
+            try:
+                self._check_retry_policies(host_policy, loop.time())
+            except UpdateFailed as err:
+                _LOGGER.debug("Stream of device %s waiting: %s", self._device_id, err)
+                await asyncio.sleep(self._stream_reconnect_delay())
+                continue
+
+            stream = FrameStream(client)
+            try:
+                async with host_limit:
+                    await stream.async_open()
+                self.stream_connections += 1
+                self.stream_connected = True
+                received = 0
+                async with contextlib.aclosing(stream.frames(idle_timeout)) as frames:
+                    async for frame in frames:
+                        received += 1
+                        self._retry_policy.record_success()
+                        host_policy.record_success()
+                        await self._async_push_frame(frame)
+                if not received:
+                    raise ConnectionError("Connection closed without any frame")
+                if received == 1:
+                    _LOGGER.info(
+                        "Endpoint of device %s does not push frames, polling instead",
+                        self._device_id,
+                    )
+                    self.stream_fallback = True
+                    break
+            except Exception as err:
+                now = loop.time()
+                self._retry_policy.record_failure(now)
+                host_policy.record_failure(now)
+                _LOGGER.debug("Stream of device %s failed: %s", self._device_id, err)
+            finally:
+                self.stream_connected = False
+                await stream.async_close()
+            await asyncio.sleep(self._stream_reconnect_delay())
+
+        self._stream_task = None
+        self._schedule_refresh()
+
+    def _stream_reconnect_delay(self) -> float:
+        """Return the seconds to wait before opening the next stream connection."""
+        now = self.hass.loop.time()
+        return max(self._next_refresh_at(now) - now, STREAM_MIN_RECONNECT_SECONDS)
+
+    async def _async_push_frame(self, frame: MappedFrame) -> None:
+        """Hand a pushed frame to the listeners unless it was already received."""
+        data = await self._async_process_frame(frame)
+        if data is self.data:
+            return
+        self.pushed_frames += 1
+        self._async_refresh_finished()
+        self.async_set_updated_data(data)
+
+    async def _async_record_frame(self, recorder: FrameRecorder, data: MappedFrame) -> None:
+        """Append a received frame, duplicates included, to the recording."""
+        try:
+            await self.hass.async_add_executor_job(recorder.write, data, dt_util.utcnow())
+        except OSError as err:
+            _LOGGER.warning("Error recording frame to %s: %s", recorder.path, err)
+
+    @property
+    def streaming(self) -> bool:
+        """Return True while frames are received over a stream instead of refreshes."""
+        return self._stream_task is not None
+
+    @property
+    def profiling(self) -> bool:
+        """Return True while refresh cycles are being profiled."""
+        return self._profiler is not None
+
+    @callback
+    def async_start_profiling(self, cycles: int, path: str) -> None:
+        """Profile the next refresh cycles and write the profile to path."""
+        self._profiler = RefreshProfiler(cycles, path)
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh data, profiling the cycle while the profile service runs."""
+        if (profiler := self._profiler) is None:
+            await super()._async_refresh(*args, **kwargs)
+            return
+
+        with profiler.cycle():
+            await super()._async_refresh(*args, **kwargs)
+        if profiler.remaining > 0:
+            return
+        self._profiler = None
+        await self.hass.async_add_executor_job(profiler.dump)
+        _LOGGER.info("Profile of device %s refreshes written to %s", self._device_id, profiler.path)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners, recording the time spent and the states written."""
+        state_writes = self.state_writes
+        started = time.perf_counter()
+        super().async_update_listeners()
+        self.recent_callback_time.add(time.perf_counter() - started)
+        self.recent_writes_per_update.add(self.state_writes - state_writes)
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Evaluate staleness once per refresh, before listeners are updated."""
+        self.data_stale = self.is_data_stale()
+        self._async_schedule_stale_timer()
+        if self._restored_unchanged:
+            # Listeners are only notified of changed data: let entities drop the restored flag
+            self._restored_unchanged = False
+            self.async_update_listeners()
+
+    @callback
+    def _async_schedule_stale_timer(self) -> None:
+        """Schedule the moment the current data becomes stale.
+
+        A single timer per device fires at last success + threshold; it is moved
+        each time a newer frame is received.
+        """
+        if self._last_update_success is None or self.data_stale:
+            return
+        deadline = self._last_update_success + self.stale_threshold
+        if self._unsub_stale is not None:
+            if deadline == self._stale_deadline:
+                return
+            self._unsub_stale()
+        self._stale_deadline = deadline
+        self._unsub_stale = async_track_point_in_utc_time(self.hass, self._stale_job, deadline)
+
+    @callback
+    def _async_handle_stale(self, _now: datetime) -> None:
+        """Mark the data stale and update every entity in one batch."""
+        self._unsub_stale = None
+        self.data_stale = True
+        self.async_update_listeners()
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return coordinator state for diagnostics."""
+        now = self.hass.loop.time()
+        return {
+            "last_update_success": self.last_update_success,
+            "last_frame_timestamp": self._last_update_success,
+            "data_stale": self.data_stale,
+            "restored": self.restored,
+            "setup": {
+                "deferred": self.deferred_setup,
+                "entry_seconds": self.setup_seconds,
+                "first_frame_seconds": self.first_frame_seconds,
+            },
+            "stale_threshold_seconds": self.stale_threshold.total_seconds(),
+            "suppressed_writes": self.suppressed_writes,
+            "state_writes": self.state_writes,
+            "polls": self.polls,
+            "duplicate_frames": self.duplicate_frames,
+            "adaptive_cadence_seconds": self._cadence.cadence if self._cadence else None,
+            "update_interval_seconds": (
+                self.update_interval.total_seconds() if self.update_interval else None
+            ),
+            "fetch_timeout_seconds": self._fetch_timeout,
+            "phase_timeout_seconds": self._phase_timeout,
+            "fetch_latency": self.fetch_latency.as_dict(),
+            "streaming": (
+                {
+                    "connected": self.stream_connected,
+                    "connections": self.stream_connections,
+                    "fallback_to_polling": self.stream_fallback,
+                    "pushed_frames": self.pushed_frames,
+                }
+                if self._streaming
+                else None
+            ),
+            "race": self.client.as_dict() if isinstance(self.client, RacingClient) else None,
+            "single_flight": (
+                self.client.as_dict() if isinstance(self.client, SingleFlightClient) else None
+            ),
+            "frame_recording": self._recorder.path if self._recorder else None,
+            "hedging": self._hedge_policy.as_dict() if self._hedge_policy else None,
+            "device_retry": self._retry_policy.as_dict(now),
+            "host_retry": (
+                self._host_retry_policy.as_dict(now) if self._host_retry_policy else None
+            ),
+        }
+
+    def is_data_stale(self, stale_minutes: float | None = None) -> bool:
         """Check if data is stale (no successful update for specified minutes).
 
         Args:
             stale_minutes: Number of minutes after which data is considered stale.
-                          Defaults to 16 minutes.
+                          Defaults to the configured stale threshold.
 
         Returns:
             True if no successful update has occurred or if the time since last
@@ -125,6 +851,9 @@ class IRegulCoordinator(DataUpdateCoordinator[MappedFrame]):
         if self._last_update_success is None:
             return False  # No updates yet, consider data not stale
 
+        threshold = (
+            self.stale_threshold if stale_minutes is None else timedelta(minutes=stale_minutes)
+        )
         now = dt_util.now()
         elapsed = now - self._last_update_success
-        return elapsed > timedelta(minutes=stale_minutes)
+        return elapsed > threshold
@@ -0,0 +1,27 @@
+"""Diagnostics support for IRegul."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_DEVICE_PASSWORD
+from .coordinator import IRegulCoordinator
+from .scheduler import async_get_scheduler
+
+TO_REDACT = {CONF_DEVICE_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: IRegulCoordinator = entry.runtime_data
+    return {
+        "entry": async_redact_data(entry.data, TO_REDACT),
+        "coordinator": coordinator.diagnostics(),
+        "scheduler": async_get_scheduler(hass).report(),
+    }
@@ -0,0 +1,290 @@
+"""Entity discovery shared by the IRegul platforms."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, cast
+
+from aioiregul.models import AnalogSensor, Input, MappedFrame, Measurement, Output
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import (
+    CONF_DEVICE_ID,
+    REMOTE_ANALOG_SENSORS_ID,
+    REMOTE_INPUTS_ID,
+    REMOTE_MEASUREMENTS_ID,
+    REMOTE_OUTPUTS_ID,
+    canonicalize_unit,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import IRegulCoordinator
+
+MeasurementGroupKey = tuple[str, str | None]
+FrameShape = tuple[tuple[tuple[object, ...], ...], ...]
+
+
+def measurement_alias(measurement: Measurement) -> str:
+    """Return the display alias of a measurement, falling back to its index."""
+    return measurement.alias or f"Measurement {measurement.index}"
+
+
+def merge_key(alias: str, canonical_unit: str | None) -> str:
+    """Build a stable merge key based on alias and canonical unit string."""
+    return f"{alias.strip().lower()}|{canonical_unit or ''}"
+
+
+def build_measurement_groups(
+    measurements: dict[int, Measurement],
+) -> dict[MeasurementGroupKey, list[tuple[int, float]]]:
+    """Group measurement ids by alias and canonical unit.
+
+    Each member is stored with the factor converting its value to the canonical unit.
+    """
+    groups: dict[MeasurementGroupKey, list[tuple[int, float]]] = {}
+    for m_id, m in measurements.items():
+        canonical_unit, factor = canonicalize_unit(m.unit)
+        groups.setdefault((measurement_alias(m), canonical_unit), []).append((m_id, factor))
+    return groups
+
+
+def frame_shape(frame: MappedFrame) -> FrameShape:
+    """Return a signature of the frame structure used by entity discovery.
+
+    Only ids, aliases, units and types are taken into account, so two frames
+    with the same items but different values share the same signature.
+    """
+    return (
+        tuple((i, m.alias, m.unit) for i, m in frame.measurements.items()),
+        tuple((i, x.alias, x.type) for i, x in frame.inputs.items()),
+        tuple((i, x.alias, x.type) for i, x in frame.outputs.items()),
+        tuple((i, x.alias, x.unit, x.type) for i, x in frame.analog_sensors.items()),
+    )
+
+
+def route_item(item_key: str, item: object) -> Platform:
+    """Return the platform an item belongs to.
+
+    Inputs and outputs of type 1 and analog sensors of type "1" are binary
+    sensors; every other item, including all measurements, is a sensor.
+    """
+    item_type = getattr(item, "type", None)
+    if item_key in (REMOTE_INPUTS_ID, REMOTE_OUTPUTS_ID) and item_type == 1:
+        return Platform.BINARY_SENSOR
+    if item_key == REMOTE_ANALOG_SENSORS_ID and item_type == "1":
+        return Platform.BINARY_SENSOR
+    return Platform.SENSOR
+
+
+# Timestamp of the frames built by registry_frame, older than any device frame
+PLACEHOLDER_TIMESTAMP = datetime.min.replace(tzinfo=UTC)
+
+# Item key of the entities whose unique id reads {device_id}_{prefix}_{index}
+_UNIQUE_ID_PREFIXES = {
+    "measurement": REMOTE_MEASUREMENTS_ID,
+    "input": REMOTE_INPUTS_ID,
+    "output": REMOTE_OUTPUTS_ID,
+    "analog_sensor": REMOTE_ANALOG_SENSORS_ID,
+}
+
+
+@callback
+def registry_frame(hass: HomeAssistant, entry: ConfigEntry) -> MappedFrame:
+    """Build a frame from the item entities registered for a config entry.
+
+    Items carry the name and unit of their entity with a zero value, never
+    shown as the entities stay unavailable until the first live frame, and are
+    typed so that route_item sends them back to the platform of their entity.
+    The frame is dated PLACEHOLDER_TIMESTAMP. Merged measurement sensors are
+    left to the first live frame.
+    """
+    device_id = entry.data[CONF_DEVICE_ID]
+    measurements: dict[int, Measurement] = {}
+    inputs: dict[int, Input] = {}
+    outputs: dict[int, Output] = {}
+    analog_sensors: dict[int, AnalogSensor] = {}
+    for entity in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id):
+        prefix, _, index = entity.unique_id.removeprefix(f"{device_id}_").rpartition("_")
+        item_key = _UNIQUE_ID_PREFIXES.get(prefix)
+        if item_key is None or not index.isdigit():
+            continue
+        item_id = int(index)
+        alias = entity.original_name or ""
+        # Unitless entities keep None: the models type units as str, but every
+        # reader of a unit also accepts None
+        unit = cast(str, entity.unit_of_measurement)
+        binary = entity.domain == Platform.BINARY_SENSOR
+        if item_key == REMOTE_MEASUREMENTS_ID:
+            measurements[item_id] = Measurement(index=item_id, valeur=0.0, unit=unit, alias=alias)
+        elif item_key == REMOTE_INPUTS_ID:
+            inputs[item_id] = Input(
+                index=item_id, valeur=0, alias=alias, type=1 if binary else None
+            )
+        elif item_key == REMOTE_OUTPUTS_ID:
+            outputs[item_id] = Output(
+                index=item_id, valeur=0, alias=alias, type=1 if binary else None
+            )
+        else:
+            analog_sensors[item_id] = AnalogSensor(
+                index=item_id, valeur=0.0, unit=unit, alias=alias, type="1" if binary else ""
+            )
+
+    return MappedFrame(
+        is_old=False,
+        timestamp=PLACEHOLDER_TIMESTAMP,
+        count=None,
+        zones={},
+        inputs=inputs,
+        outputs=outputs,
+        measurements=measurements,
+        parameters={},
+        labels={},
+        modbus_registers={},
+        analog_sensors=analog_sensors,
+        configuration=None,
+        memory=None,
+    )
+
+
+@dataclass(slots=True)
+class DiscoveredItems:
+    """Items newly routed to a platform."""
+
+    merged_measurements: list[MeasurementGroupKey] = field(default_factory=list)
+    measurements: list[Measurement] = field(default_factory=list)
+    inputs: list[Input] = field(default_factory=list)
+    outputs: list[Output] = field(default_factory=list)
+    analog_sensors: list[AnalogSensor] = field(default_factory=list)
+
+
+DiscoveryHandler = Callable[[DiscoveredItems], None]
+
+_ITEM_KEYS = (REMOTE_INPUTS_ID, REMOTE_OUTPUTS_ID, REMOTE_ANALOG_SENSORS_ID)
+
+
+class IRegulDiscovery:
+    """Classify coordinator frames once and hand new items to each platform."""
+
+    def __init__(self, coordinator: IRegulCoordinator) -> None:
+        """Initialize the discovery engine."""
+        self._coordinator = coordinator
+        self._handlers: dict[Platform, DiscoveryHandler] = {}
+        self._known: dict[Platform, dict[str, set[int]]] = {}
+        # Track merged measurement sensors using a key of alias + unit
+        self._known_merged_measurements: set[str] = set()
+        # Item ids of the current frame grouped per platform and item key
+        self._routes: dict[Platform, dict[str, list[int]]] = {}
+        self._shape: FrameShape | None = None
+        self._unsub_coordinator: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_platform(self, platform: Platform, handler: DiscoveryHandler) -> CALLBACK_TYPE:
+        """Register a platform handler and hand it the items already known.
+
+        Returns a callback that unregisters the handler.
+        """
+        self._handlers[platform] = handler
+        self._known[platform] = {key: set() for key in (REMOTE_MEASUREMENTS_ID, *_ITEM_KEYS)}
+        if platform is Platform.SENSOR:
+            self._known_merged_measurements.clear()
+        if self._unsub_coordinator is None:
+            self._unsub_coordinator = self._coordinator.async_add_listener(
+                self._async_handle_update
+            )
+        self._async_classify()
+        self._async_dispatch(platform)
+
+        @callback
+        def _async_remove_platform() -> None:
+            self._handlers.pop(platform, None)
+            self._known.pop(platform, None)
+            if not self._handlers and self._unsub_coordinator is not None:
+                self._unsub_coordinator()
+                self._unsub_coordinator = None
+
+        return _async_remove_platform
+
+    @callback
+    def _async_handle_update(self) -> None:
+        """Dispatch new items when the frame structure changed."""
+        # Skip discovery while the frame structure is unchanged
+        if not self._async_classify():
+            return
+        for platform in list(self._handlers):
+            self._async_dispatch(platform)
+
+    @callback
+    def _async_classify(self) -> bool:
+        """Route every item of the current frame to its platform in a single pass.
+
+        Returns False when the frame structure did not change since the last pass.
+        """
+        shape = self._coordinator.frame_shape
+        if shape is not None and shape == self._shape:
+            return False
+        self._shape = shape
+
+        routes: dict[Platform, dict[str, list[int]]] = {
+            platform: {key: [] for key in _ITEM_KEYS}
+            for platform in (Platform.SENSOR, Platform.BINARY_SENSOR)
+        }
+        data = self._coordinator.data
+        for item_key in _ITEM_KEYS:
+            for item_id, item in getattr(data, item_key).items():
+                routes[route_item(item_key, item)][item_key].append(item_id)
+        self._routes = routes
+        return True
+
+    @callback
+    def _async_dispatch(self, platform: Platform) -> None:
+        """Hand the platform handler the items it has not seen yet."""
+        known = self._known[platform]
+        new_items = DiscoveredItems()
+        if platform is Platform.SENSOR:
+            self._collect_measurements(known[REMOTE_MEASUREMENTS_ID], new_items)
+
+        data = self._coordinator.data
+        for item_key, item_ids in self._routes.get(platform, {}).items():
+            known_ids = known[item_key]
+            # Hand out the items of the current frame so entities start with fresh values
+            items: dict[int, object] = getattr(data, item_key)
+            new_list: list[object] = getattr(new_items, item_key)
+            for item_id in item_ids:
+                if item_id in known_ids:
+                    continue
+                known_ids.add(item_id)
+                new_list.append(items[item_id])
+
+        self._handlers[platform](new_items)
+
+    def _collect_measurements(self, known_ids: set[int], new_items: DiscoveredItems) -> None:
+        """Collect new merged and individual measurements."""
+        # Create merged sensors for groups with duplicate alias+unit
+        for group, items in self._coordinator.measurement_groups.items():
+            if len(items) < 2:
+                continue
+            key = merge_key(*group)
+            # Avoid creating a merged sensor if any item already has an individual sensor
+            if key in self._known_merged_measurements or any(
+                m_id in known_ids for m_id, _ in items
+            ):
+                # Mark all measurements as known so we don't add individuals later
+                known_ids.update(m_id for m_id, _ in items)
+                continue
+
+            self._known_merged_measurements.add(key)
+            # Mark all indices as known to prevent individual sensors
+            known_ids.update(m_id for m_id, _ in items)
+            new_items.merged_measurements.append(group)
+
+        # Add remaining individual measurement sensors
+        for measurement_id, measurement in self._coordinator.data.measurements.items():
+            if measurement_id in known_ids:
+                continue
+            known_ids.add(measurement_id)
+            new_items.measurements.append(measurement)
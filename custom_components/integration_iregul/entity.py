@@ -2,19 +2,55 @@
 
 from __future__ import annotations
 
+from collections.abc import Hashable
+from typing import Any
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_DEVICE_ID, DOMAIN
+from .const import ATTR_FROM_SAVED_FRAME, CONF_DEVICE_ID, DOMAIN
 from .coordinator import IRegulCoordinator
 
+# Item fields that can influence an entity state; others are ignored for change detection
+_SIGNATURE_FIELDS = ("valeur", "etat", "alias", "unit", "type")
 
-class IRegulEntity(CoordinatorEntity[IRegulCoordinator]):
-    """Base entity for IRegul data with shared behavior."""
+# Signature recorded while the entity is unavailable
+_UNAVAILABLE_SIGNATURE = ("unavailable",)
+
+
+class IRegulBaseEntity(CoordinatorEntity[IRegulCoordinator]):
+    """Coordinator entity that skips state writes when nothing has changed."""
 
     _attr_has_entity_name = True
+    _last_state_signature: Hashable | None = None
+
+    @callback
+    def _async_state_unchanged(self, signature: Hashable) -> bool:
+        """Return True if the signature matches the last written state.
+
+        Unchanged states are counted on the coordinator as suppressed writes;
+        otherwise the signature is recorded as the new reference and the coming
+        write is counted. Restored data is part of the signature, so the state is
+        written again once live data replaces it.
+        """
+        signature = (self.coordinator.restored, signature)
+        if signature == self._last_state_signature:
+            self.coordinator.suppressed_writes += 1
+            return True
+        self._last_state_signature = signature
+        self.coordinator.state_writes += 1
+        return False
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag states built from the frame saved before the last restart."""
+        return {ATTR_FROM_SAVED_FRAME: True} if self.coordinator.restored else None
+
+
+class IRegulEntity(IRegulBaseEntity):
+    """Base entity for IRegul data with shared behavior."""
 
     def __init__(
         self,
@@ -47,17 +83,27 @@ class IRegulEntity(CoordinatorEntity[IRegulCoordinator]):
     @property
     def available(self) -> bool:
         """Return if entity is available based on coordinator freshness and item presence."""
-        items = self._get_items()
-        return super().available and not self.coordinator.is_data_stale() and self._item_id in items
+        return (
+            super().available
+            and not self.coordinator.data_stale
+            and self._item_id in self._get_items()
+        )
+
+    def _item_signature(self, item: object) -> tuple[object, ...]:
+        """Return the item fields that affect the entity state."""
+        return tuple(getattr(item, field, None) for field in _SIGNATURE_FIELDS)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         if not self.available:
-            self.async_write_ha_state()
+            if not self._async_state_unchanged(_UNAVAILABLE_SIGNATURE):
+                self.async_write_ha_state()
             return
 
         item = self._get_items()[self._item_id]
+        if self._async_state_unchanged(self._item_signature(item)):
+            return
         self._update(item)
         self.async_write_ha_state()
 
@@ -0,0 +1,202 @@
+"""Polling policies for the IRegul coordinator."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from enum import StrEnum
+from typing import Any
+
+from .stats import RollingWindow
+
+# Weight of the newest interval in the cadence moving average
+CADENCE_SMOOTHING = 0.3
+
+# Seconds waited after the expected frame time before fetching it
+CADENCE_MARGIN_SECONDS = 5.0
+
+
+class FrameCadence:
+    """Learn how often a device publishes frames from their timestamps.
+
+    The cadence is an exponential moving average of the delay between two
+    consecutive distinct frame timestamps. Timestamps come from the device
+    clock, so the computed delays are always clamped by the caller bounds.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cadence estimator."""
+        self.cadence: float | None = None
+        self.last_timestamp: datetime | None = None
+
+    def observe(self, timestamp: datetime) -> bool:
+        """Record a frame timestamp.
+
+        Returns False when the timestamp did not advance, i.e. the frame was
+        already received.
+        """
+        last = self.last_timestamp
+        if last is not None:
+            delta = (timestamp - last).total_seconds()
+            if delta <= 0:
+                return False
+            self.cadence = (
+                delta
+                if self.cadence is None
+                else (1 - CADENCE_SMOOTHING) * self.cadence + CADENCE_SMOOTHING * delta
+            )
+        self.last_timestamp = timestamp
+        return True
+
+    def next_delay(self, now: datetime, min_seconds: float, max_seconds: float) -> float:
+        """Return the delay in seconds until just after the next expected frame.
+
+        Until a cadence has been learned, or when the expected frame is late,
+        the bounds are used: max_seconds before the first interval is known and
+        min_seconds while waiting for a late frame.
+        """
+        if self.cadence is None or self.last_timestamp is None:
+            return max_seconds
+        expected = self.last_timestamp + timedelta(seconds=self.cadence + CADENCE_MARGIN_SECONDS)
+        delay = (expected - now).total_seconds()
+        if delay <= 0:
+            return min_seconds
+        return min(max(delay, min_seconds), max_seconds)
+
+
+class CircuitState(StrEnum):
+    """State of a retry policy circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter behind a half-open circuit breaker.
+
+    After failure_threshold consecutive failures the circuit opens and
+    requests are refused for a backoff delay of base * 2^(failures - 1),
+    capped at max_delay, of which the upper half is randomized so devices
+    do not retry in lockstep. Once the delay has elapsed, a single probe
+    request is allowed (half-open): its success closes the circuit, its
+    failure opens it again for a longer delay. Times are in event loop time.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_delay: float,
+        max_delay: float,
+        failure_threshold: int = 1,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        """Initialize the retry policy."""
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self._rand = rand
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.open_until = 0.0
+        self.rejected = 0
+
+    def backoff(self) -> float:
+        """Return the jittered delay for the current number of failures."""
+        delay = min(self.max_delay, self.base_delay * 2 ** max(self.failures - 1, 0))
+        return delay / 2 + self._rand() * delay / 2
+
+    def allow_request(self, now: float) -> bool:
+        """Return True if a request may be sent now."""
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self.state is CircuitState.OPEN and now >= self.open_until:
+            # Let a single probe through
+            self.state = CircuitState.HALF_OPEN
+            return True
+        self.rejected += 1
+        return False
+
+    def refuses(self, now: float) -> bool:
+        """Return True, counting the rejection, when a request would be refused now.
+
+        Unlike allow_request, an elapsed delay does not let the probe through,
+        so another policy may still refuse the request first.
+        """
+        if self.state is CircuitState.CLOSED:
+            return False
+        if self.state is CircuitState.OPEN and now >= self.open_until:
+            return False
+        self.rejected += 1
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+
+    def record_failure(self, now: float) -> None:
+        """Count a failed request and open the circuit when needed."""
+        self.failures += 1
+        if self.state is CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = CircuitState.OPEN
+            self.open_until = now + self.backoff()
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the policy state for diagnostics."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "retry_in_seconds": (
+                round(max(self.open_until - now, 0.0), 1)
+                if self.state is CircuitState.OPEN
+                else None
+            ),
+            "rejected_requests": self.rejected,
+        }
+
+
+class HedgePolicy:
+    """Decide when a slow fetch gets a duplicate request, within a budget.
+
+    A fetch still running after the quantile of recent latencies is hedged:
+    one duplicate request is sent and whichever answers first is kept. Every
+    fetch earns budget_ratio of a hedge, banked up to a single one, so hedges
+    never exceed that share of the requests nor come in bursts.
+    """
+
+    def __init__(
+        self,
+        *,
+        quantile: float,
+        budget_ratio: float,
+        min_samples: int,
+    ) -> None:
+        """Initialize the hedge policy."""
+        self.quantile = quantile
+        self.budget_ratio = budget_ratio
+        self.min_samples = min_samples
+        self._tokens = 0.0
+        self.hedges = 0
+        self.wins = 0
+
+    def delay(self, latencies: RollingWindow) -> float | None:
+        """Count a fetch and return the delay before hedging it, if it may be hedged."""
+        self._tokens = min(self._tokens + self.budget_ratio, 1.0)
+        if len(latencies) < self.min_samples or self._tokens < 1.0:
+            return None
+        return latencies.percentile(self.quantile)
+
+    def record_hedge(self) -> None:
+        """Spend the budget of a hedge that was sent."""
+        self._tokens -= 1.0
+        self.hedges += 1
+
+    def record_win(self) -> None:
+        """Count a hedge that answered before the original request."""
+        self.wins += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the hedge counters for diagnostics."""
+        return {"hedges": self.hedges, "wins": self.wins}
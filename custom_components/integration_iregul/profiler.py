@@ -0,0 +1,36 @@
+"""On-demand profiling of IRegul refresh cycles."""
+
+from __future__ import annotations
+
+import cProfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class RefreshProfiler:
+    """Collect a single cProfile profile over a number of refresh cycles.
+
+    The profiler is only enabled while a refresh runs, i.e. while fetching the
+    frame and fanning it out to discovery and entities. It is process wide, so
+    other tasks running while the refresh awaits I/O are profiled as well.
+    """
+
+    def __init__(self, cycles: int, path: str) -> None:
+        """Initialize the profiler."""
+        self.remaining = cycles
+        self.path = path
+        self._profile = cProfile.Profile()
+
+    @contextmanager
+    def cycle(self) -> Iterator[None]:
+        """Profile one refresh cycle."""
+        self._profile.enable()
+        try:
+            yield
+        finally:
+            self._profile.disable()
+            self.remaining -= 1
+
+    def dump(self) -> None:
+        """Write the profile in pstats format; blocking, run it in the executor."""
+        self._profile.dump_stats(self.path)
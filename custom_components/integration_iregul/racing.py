@@ -0,0 +1,199 @@
+"""Query a device through several endpoints and keep the fastest answer."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from aioiregul.iregulapi import IRegulApiInterface
+from aioiregul.models import MappedFrame
+
+from .client_pool import HostLimit
+from .polling import CircuitState, RetryPolicy
+from .stats import RollingWindow
+
+
+@dataclass(slots=True)
+class RacePath:
+    """Client reaching a device through one endpoint, with its race record.
+
+    The limit and retry policy are those of the endpoint host, shared with
+    the other devices using it.
+    """
+
+    name: str
+    client: IRegulApiInterface
+    limit: HostLimit | None = None
+    retry_policy: RetryPolicy | None = None
+    wins: int = 0
+    failures: int = 0
+    latency: RollingWindow = field(default_factory=RollingWindow)
+
+    @property
+    def score(self) -> int:
+        """Return the races won net of the failures."""
+        return self.wins - self.failures
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the path record for diagnostics."""
+        return {
+            "wins": self.wins,
+            "failures": self.failures,
+            "latency_p50": self.latency.percentile(0.5),
+            "latency_p95": self.latency.percentile(0.95),
+            "host_retry": self.retry_policy.as_dict(now) if self.retry_policy else None,
+        }
+
+
+class RacingClient(IRegulApiInterface):
+    """Send reads through the best path, racing every path while it is unclear.
+
+    Until a path leads every other one by settle_lead races won net of
+    failures, each read goes to every path at once: the first valid answer is
+    kept and the slower requests are cancelled. Once a leader stands out,
+    reads only go through it, and every probe_every-th read races again so
+    the records follow the endpoints over time. A failure of the leader
+    costs it the lead and the read is raced through the other paths instead.
+    Commands with a side effect, such as defrost, are only sent through the
+    preferred path.
+    """
+
+    def __init__(
+        self,
+        paths: list[RacePath],
+        *,
+        settle_lead: int,
+        probe_every: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the client; the first path is preferred until a race is won."""
+        self.paths = paths
+        self.settle_lead = settle_lead
+        self.probe_every = probe_every
+        self._clock = clock
+        self._reads = 0
+        self.races = 0
+
+    @property
+    def preferred(self) -> RacePath:
+        """Return the path winning most races, the first one on ties."""
+        return max(self.paths, key=lambda path: path.score)
+
+    @property
+    def leader(self) -> RacePath | None:
+        """Return the path used alone, or None while races are undecided."""
+        preferred = self.preferred
+        lead = min(
+            (preferred.score - path.score for path in self.paths if path is not preferred),
+            default=self.settle_lead,
+        )
+        return preferred if lead >= self.settle_lead else None
+
+    async def _async_attempt[T](
+        self, path: RacePath, call: Callable[[IRegulApiInterface], Awaitable[T]]
+    ) -> T:
+        """Run call through a path, within the limit and retry policy of its host."""
+        policy = path.retry_policy
+        if policy is not None and not policy.allow_request(self._clock()):
+            raise ConnectionError(f"Endpoint of the {path.name} path is backing off")
+        started = self._clock()
+        try:
+            async with path.limit or contextlib.nullcontext():
+                result = await call(path.client)
+        except asyncio.CancelledError:
+            # A cancelled probe would otherwise keep the circuit half-open for good
+            if policy is not None and policy.state is CircuitState.HALF_OPEN:
+                policy.record_failure(self._clock())
+            raise
+        except Exception:
+            if policy is not None:
+                policy.record_failure(self._clock())
+            raise
+        if policy is not None:
+            policy.record_success()
+        if result:
+            path.latency.add(self._clock() - started)
+        return result
+
+    async def _async_race[T](
+        self, paths: list[RacePath], call: Callable[[IRegulApiInterface], Awaitable[T]]
+    ) -> T | None:
+        """Run call through every path and return the first truthy result.
+
+        Returns the last falsy result when no path gives a valid one, and raises
+        the first error when every path fails.
+        """
+        self.races += 1
+        tasks = {asyncio.create_task(self._async_attempt(path, call)): path for path in paths}
+        pending = set(tasks)
+        errors: list[BaseException] = []
+        result: T | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    path = tasks[task]
+                    if (error := task.exception()) is not None:
+                        path.failures += 1
+                        errors.append(error)
+                        continue
+                    result = task.result()
+                    if result:
+                        path.wins += 1
+                        return result
+                    path.failures += 1
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+            for task in pending:
+                # A loser that failed before being cancelled must not log its error
+                if not task.cancelled():
+                    task.exception()
+        if errors and len(errors) == len(tasks):
+            raise errors[0]
+        return result
+
+    async def _async_read[T](self, call: Callable[[IRegulApiInterface], Awaitable[T]]) -> T | None:
+        """Run a read through the leader, or race it when there is none."""
+        self._reads += 1
+        leader = self.leader
+        if leader is None or self._reads % self.probe_every == 0:
+            return await self._async_race(self.paths, call)
+        try:
+            result = await self._async_attempt(leader, call)
+        except Exception:
+            result = None
+        if result:
+            return result
+        leader.failures += 1
+        return await self._async_race([path for path in self.paths if path is not leader], call)
+
+    async def get_data(self) -> MappedFrame | None:
+        """Return a frame from the leader, or the first received through any path."""
+        return await self._async_read(lambda client: client.get_data())
+
+    async def check_auth(self) -> bool:
+        """Return True when the credentials are accepted through a path."""
+        return bool(await self._async_read(lambda client: client.check_auth()))
+
+    async def defrost(self) -> bool:
+        """Trigger a defrost through the preferred path only."""
+        return await self.preferred.client.defrost()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record of each path for diagnostics."""
+        leader = self.leader
+        now = self._clock()
+        return {
+            "preferred": self.preferred.name,
+            "leader": leader.name if leader else None,
+            "races": self.races,
+            "reads": self._reads,
+            "paths": {path.name: path.as_dict(now) for path in self.paths},
+        }
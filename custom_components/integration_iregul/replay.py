@@ -0,0 +1,163 @@
+"""Record IRegul frames to disk and replay them as an API client."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from aioiregul.iregulapi import IRegulApiInterface
+from aioiregul.models import (
+    AnalogSensor,
+    Configuration,
+    Input,
+    Label,
+    MappedFrame,
+    Measurement,
+    Memory,
+    ModbusRegister,
+    Output,
+    Parameter,
+    Zone,
+)
+
+# Frame item groups and the model of their items
+_ITEM_MODELS: dict[str, type[Any]] = {
+    "zones": Zone,
+    "inputs": Input,
+    "outputs": Output,
+    "measurements": Measurement,
+    "parameters": Parameter,
+    "labels": Label,
+    "modbus_registers": ModbusRegister,
+    "analog_sensors": AnalogSensor,
+}
+
+
+def frame_to_dict(frame: MappedFrame) -> dict[str, Any]:
+    """Return a JSON serializable representation of a frame, as MappedFrame.as_json."""
+    payload = asdict(frame)
+    payload["timestamp"] = frame.timestamp.isoformat()
+    return payload
+
+
+def frame_from_dict(payload: dict[str, Any]) -> MappedFrame:
+    """Rebuild a frame from frame_to_dict output decoded from JSON."""
+    configuration = payload.get("configuration")
+    memory = payload.get("memory")
+    return MappedFrame(
+        is_old=payload["is_old"],
+        timestamp=datetime.fromisoformat(payload["timestamp"]),
+        count=payload["count"],
+        # JSON object keys are strings; item ids are integers
+        **{
+            key: {int(item_id): model(**item) for item_id, item in payload[key].items()}
+            for key, model in _ITEM_MODELS.items()
+        },
+        configuration=Configuration(**configuration) if configuration else None,
+        memory=Memory(**memory) if memory else None,
+    )
+
+
+class FrameRecorder:
+    """Append received frames to a gzip-compressed JSONL file.
+
+    Each record is written as its own gzip member, so the file stays valid if
+    Home Assistant stops mid-write and can be read back as a single stream.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the recorder."""
+        self.path = path
+
+    def write(self, frame: MappedFrame, received: datetime) -> None:
+        """Append a frame; blocking, run it in the executor."""
+        line = json.dumps(
+            {"received": received.isoformat(), "frame": frame_to_dict(frame)},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        with gzip.open(self.path, "at", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+
+def read_recording(path: str | Path) -> list[tuple[datetime, MappedFrame]]:
+    """Return the recorded frames with the time they were received."""
+    records: list[tuple[datetime, MappedFrame]] = []
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            records.append(
+                (datetime.fromisoformat(record["received"]), frame_from_dict(record["frame"]))
+            )
+    return records
+
+
+class ReplayClient(IRegulApiInterface):
+    """API client serving frames from a recording.
+
+    Without a speed, each call returns the next recorded frame. With a speed,
+    the recording plays like a live device: a call returns the frame received
+    last at the matching point of the recording, speed times faster than it
+    was recorded, so polls see the same duplicates and gaps as in production.
+    Once the recording is exhausted, the last frame is returned again.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        speed: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the client."""
+        self.path = path
+        self.speed = speed
+        self._clock = clock
+        self._records: list[tuple[datetime, MappedFrame]] | None = None
+        self._position = 0
+        self._started: float | None = None
+
+    async def _async_records(self) -> list[tuple[datetime, MappedFrame]]:
+        """Load the recording on first use."""
+        if self._records is None:
+            self._records = await asyncio.to_thread(read_recording, self.path)
+        return self._records
+
+    async def get_data(self) -> MappedFrame | None:
+        """Return the next recorded frame, or the current one when paced."""
+        records = await self._async_records()
+        if not records:
+            return None
+        if self.speed is None:
+            position = min(self._position, len(records) - 1)
+            self._position += 1
+            return records[position][1]
+
+        now = self._clock()
+        if self._started is None:
+            self._started = now
+        first_received = records[0][0]
+        elapsed = (now - self._started) * self.speed
+        while (
+            self._position + 1 < len(records)
+            and (records[self._position + 1][0] - first_received).total_seconds() <= elapsed
+        ):
+            self._position += 1
+        return records[self._position][1]
+
+    async def check_auth(self) -> bool:
+        """Accept any credentials."""
+        return True
+
+    async def defrost(self) -> bool:
+        """Ignore defrost requests."""
+        return False
@@ -0,0 +1,127 @@
+"""Fleet-wide refresh scheduling for IRegul devices."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any
+from zlib import crc32
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+DATA_SCHEDULER: HassKey[IRegulRefreshScheduler] = HassKey(f"{DOMAIN}_scheduler")
+
+# Fraction of the interval under which the next slot is skipped, so a refresh
+# made outside of the schedule is not immediately followed by another one
+MIN_SLOT_GAP_RATIO = 0.25
+
+
+@dataclass(slots=True)
+class _ScheduledDevice:
+    """Refresh interval and last refresh start of a device."""
+
+    interval: float
+    last_start: float | None = None
+
+
+class IRegulRefreshScheduler:
+    """Spread the refreshes of all IRegul devices evenly over their interval.
+
+    Devices sharing an interval are ordered by a stable hash of their id and
+    each one gets a phase offset of interval * rank / count, so refreshes
+    against the cloud endpoint are evenly spaced instead of firing in bursts.
+    Times are expressed in event loop time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._devices: dict[str, _ScheduledDevice] = {}
+        self._phases: dict[str, float] = {}
+
+    @callback
+    def async_register(self, device_id: str, interval: float) -> CALLBACK_TYPE:
+        """Register a device refreshing every interval seconds.
+
+        Returns a callback that unregisters the device.
+        """
+        self._devices[device_id] = _ScheduledDevice(interval)
+        self._compute_phases()
+
+        @callback
+        def _async_unregister() -> None:
+            if self._devices.pop(device_id, None) is not None:
+                self._compute_phases()
+
+        return _async_unregister
+
+    def _compute_phases(self) -> None:
+        """Assign each device its deterministic phase within its interval."""
+        groups: dict[float, list[str]] = {}
+        for device_id, device in self._devices.items():
+            groups.setdefault(device.interval, []).append(device_id)
+
+        phases: dict[str, float] = {}
+        for interval, device_ids in groups.items():
+            device_ids.sort(key=lambda device_id: (crc32(device_id.encode()), device_id))
+            for rank, device_id in enumerate(device_ids):
+                phases[device_id] = interval * rank / len(device_ids)
+        self._phases = phases
+
+    def next_refresh(self, device_id: str, now: float) -> float:
+        """Return the loop time of the next refresh slot of a device."""
+        device = self._devices[device_id]
+        interval = device.interval
+        phase = self._phases[device_id]
+        slot = phase + (math.floor((now - phase) / interval) + 1) * interval
+        if slot - now < interval * MIN_SLOT_GAP_RATIO:
+            slot += interval
+        return slot
+
+    @callback
+    def async_record_refresh(self, device_id: str, now: float) -> None:
+        """Record the loop time at which a device started a refresh."""
+        if (device := self._devices.get(device_id)) is not None:
+            device.last_start = now
+
+    def report(self) -> dict[str, Any]:
+        """Return how evenly refreshes are spread for each interval.
+
+        The spread ratio compares the smallest gap between two devices with
+        the ideal gap (interval / devices); 1.0 means perfectly even, values
+        close to 0 mean devices refresh in bursts.
+        """
+        groups: dict[float, list[_ScheduledDevice]] = {}
+        for device in self._devices.values():
+            groups.setdefault(device.interval, []).append(device)
+
+        intervals: list[dict[str, Any]] = []
+        for interval, devices in sorted(groups.items()):
+            ideal_gap = interval / len(devices)
+            offsets = sorted(
+                device.last_start % interval for device in devices if device.last_start is not None
+            )
+            observed: float | None = None
+            if len(offsets) == len(devices) and len(devices) > 1:
+                gaps = [b - a for a, b in zip(offsets, offsets[1:], strict=False)]
+                gaps.append(offsets[0] + interval - offsets[-1])
+                observed = round(min(gaps) / ideal_gap, 3)
+            intervals.append(
+                {
+                    "interval_seconds": interval,
+                    "devices": len(devices),
+                    "ideal_gap_seconds": round(ideal_gap, 3),
+                    "observed_spread_ratio": observed,
+                }
+            )
+        return {"intervals": intervals}
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> IRegulRefreshScheduler:
+    """Return the refresh scheduler shared by all IRegul config entries."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = IRegulRefreshScheduler()
+    return scheduler
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 
 from aioiregul.models import (
@@ -14,19 +16,29 @@ from aioiregul.models import (
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE
+from homeassistant.const import PERCENTAGE, Platform, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .const import CONF_DEVICE_ID, DOMAIN, canonicalize_unit, get_unit_config
+from .const import (
+    CONF_DEVICE_ID,
+    DOMAIN,
+    REMOTE_ANALOG_SENSORS_ID,
+    REMOTE_INPUTS_ID,
+    REMOTE_MEASUREMENTS_ID,
+    REMOTE_OUTPUTS_ID,
+    get_unit_config,
+)
 from .coordinator import IRegulCoordinator
-from .entity import IRegulEntity
+from .discovery import PLACEHOLDER_TIMESTAMP, DiscoveredItems, merge_key
+from .entity import IRegulBaseEntity, IRegulEntity
 
 
 async def async_setup_entry(
@@ -40,147 +52,64 @@ async def async_setup_entry(
             IRegulLastMessageSensor(
                 coordinator=coordinator,
                 entry=entry,
-            )
+            ),
+            *(
+                IRegulPerformanceSensor(
+                    coordinator=coordinator, entry=entry, description=description
+                )
+                for description in PERFORMANCE_SENSORS
+            ),
         ]
     )
-    known_measurement_ids: set[int] = set()
-    known_input_ids: set[int] = set()
-    known_output_ids: set[int] = set()
-    known_analog_sensor_ids: set[int] = set()
-    # Track merged measurement sensors using a key of alias + unit
-    known_merged_measurements: set[str] = set()
-
-    def _merge_key(alias: str, unit: str | None) -> str:
-        """Build a stable merge key based on alias and canonical unit string."""
-        canonical_unit, _ = canonicalize_unit(unit)
-        unit_key = canonical_unit or ""
-        return f"{alias.strip().lower()}|{unit_key}"
 
     @callback
-    def _async_add_new_entities() -> None:
+    def _async_add_new_entities(items: DiscoveredItems) -> None:
         """Add new sensors for any new measurements, inputs, outputs, and analog sensors."""
-
         new_entities: list[
             IRegulMeasurementSensor
             | IRegulInputSensor
             | IRegulOutputSensor
             | IRegulAnalogSensorSensor
             | IRegulMergedMeasurementSensor
-        ] = []
-
-        # Group measurements by alias and unit to detect duplicates
-        measurements_by_alias: dict[str, dict[str | None, list[tuple[int, Measurement]]]] = {}
-        for m_id, m in coordinator.data.measurements.items():
-            alias = m.alias or f"Measurement {m.index}"
-            canonical_unit, _ = canonicalize_unit(m.unit)
-            measurements_by_alias.setdefault(alias, {}).setdefault(canonical_unit, []).append(
-                (m_id, m)
-            )
-
-        # Create merged sensors for groups with duplicate alias+unit
-        for alias, unit_groups in measurements_by_alias.items():
-            for unit, items in unit_groups.items():
-                if len(items) < 2:
-                    continue
-                key = _merge_key(alias, unit)
-                # Avoid creating a merged sensor if any item already has an individual sensor
-                if key in known_merged_measurements:
-                    # Mark all measurements as known so we don't add individuals later
-                    for m_id, _ in items:
-                        known_measurement_ids.add(m_id)
-                    continue
-                if any(m_id in known_measurement_ids for m_id, _ in items):
-                    # Some individuals already created earlier; skip merging to avoid duplicates
-                    for m_id, _ in items:
-                        known_measurement_ids.add(m_id)
-                    continue
-
-                known_merged_measurements.add(key)
-                # Mark all indices as known to prevent individual sensors
-                for m_id, _ in items:
-                    known_measurement_ids.add(m_id)
-                new_entities.append(
-                    IRegulMergedMeasurementSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        alias=alias,
-                        canonical_unit=unit,
-                    )
-                )
-
-        # Add remaining individual measurement sensors
-        for measurement_id, measurement in coordinator.data.measurements.items():
-            if measurement_id in known_measurement_ids:
-                continue
-
-            known_measurement_ids.add(measurement_id)
-            new_entities.append(
-                IRegulMeasurementSensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    measurement=measurement,
-                )
-            )
-
-        # Add input sensors (type != 1)
-        for input_id, input_sensor in coordinator.data.inputs.items():
-            if input_id in known_input_ids:
-                continue
-            if input_sensor.type == 1:
-                continue
-
-            known_input_ids.add(input_id)
-            new_entities.append(
-                IRegulInputSensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    input_sensor=input_sensor,
-                )
-            )
-
-        # Add output sensors (type != 1)
-        for output_id, output_sensor in coordinator.data.outputs.items():
-            if output_id in known_output_ids:
-                continue
-            if output_sensor.type == 1:
-                continue
-
-            known_output_ids.add(output_id)
-            new_entities.append(
-                IRegulOutputSensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    output_sensor=output_sensor,
-                )
+        ] = [
+            IRegulMergedMeasurementSensor(
+                coordinator=coordinator,
+                entry=entry,
+                alias=alias,
+                canonical_unit=unit,
             )
-
-        # Add analog sensor sensors (type != "1")
-        for analog_sensor_id, analog_sensor in coordinator.data.analog_sensors.items():
-            if analog_sensor_id in known_analog_sensor_ids:
-                continue
-            if analog_sensor.type == "1":
-                continue
-
-            known_analog_sensor_ids.add(analog_sensor_id)
-            new_entities.append(
-                IRegulAnalogSensorSensor(
-                    coordinator=coordinator,
-                    entry=entry,
-                    analog_sensor=analog_sensor,
-                )
+            for alias, unit in items.merged_measurements
+        ]
+        new_entities.extend(
+            IRegulMeasurementSensor(coordinator=coordinator, entry=entry, measurement=measurement)
+            for measurement in items.measurements
+        )
+        new_entities.extend(
+            IRegulInputSensor(coordinator=coordinator, entry=entry, input_sensor=input_sensor)
+            for input_sensor in items.inputs
+        )
+        new_entities.extend(
+            IRegulOutputSensor(coordinator=coordinator, entry=entry, output_sensor=output_sensor)
+            for output_sensor in items.outputs
+        )
+        new_entities.extend(
+            IRegulAnalogSensorSensor(
+                coordinator=coordinator, entry=entry, analog_sensor=analog_sensor
             )
+            for analog_sensor in items.analog_sensors
+        )
 
         if new_entities:
             async_add_entities(new_entities)
 
-    _async_add_new_entities()
-    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_entities))
+    entry.async_on_unload(
+        coordinator.discovery.async_add_platform(Platform.SENSOR, _async_add_new_entities)
+    )
 
 
-class IRegulLastMessageSensor(CoordinatorEntity[IRegulCoordinator], SensorEntity):
+class IRegulLastMessageSensor(IRegulBaseEntity, SensorEntity):
     """Sensor showing the timestamp of the last received message."""
 
-    _attr_has_entity_name = True
     _attr_translation_key = "last_message_received"
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -206,20 +135,170 @@ class IRegulLastMessageSensor(CoordinatorEntity[IRegulCoordinator], SensorEntity
     def _get_timestamp(self, frame: MappedFrame) -> datetime | None:
         """Return the most recent timestamp in UTC."""
         timestamp = frame.timestamp
-        if timestamp is None:
+        if timestamp is None or timestamp == PLACEHOLDER_TIMESTAMP:
             return None
         return dt_util.as_utc(timestamp)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_native_value = self._get_timestamp(self.coordinator.data)
+        timestamp = self._get_timestamp(self.coordinator.data)
+        if self._async_state_unchanged((self.available, timestamp)):
+            return
+        self._attr_native_value = timestamp
+        self.async_write_ha_state()
+
+
+@dataclass(frozen=True, kw_only=True)
+class IRegulPerformanceSensorEntityDescription(SensorEntityDescription):
+    """Describe a diagnostic sensor reading a coordinator statistic."""
+
+    value_fn: Callable[[IRegulCoordinator], float | None]
+
+
+def _frame_item_count(coordinator: IRegulCoordinator) -> int:
+    """Return the number of items in the current frame."""
+    data = coordinator.data
+    return sum(
+        len(getattr(data, item_key))
+        for item_key in (
+            REMOTE_MEASUREMENTS_ID,
+            REMOTE_INPUTS_ID,
+            REMOTE_OUTPUTS_ID,
+            REMOTE_ANALOG_SENSORS_ID,
+        )
+    )
+
+
+def _scaled(value: float | None, factor: float) -> float | None:
+    """Scale an optional statistic."""
+    return None if value is None else value * factor
+
+
+PERFORMANCE_SENSORS: tuple[IRegulPerformanceSensorEntityDescription, ...] = (
+    IRegulPerformanceSensorEntityDescription(
+        key="fetch_latency_last",
+        translation_key="fetch_latency_last",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=3,
+        value_fn=lambda coordinator: coordinator.recent_fetch_latency.last,
+    ),
+    IRegulPerformanceSensorEntityDescription(
+        key="fetch_latency_p50",
+        translation_key="fetch_latency_p50",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=3,
+        value_fn=lambda coordinator: coordinator.recent_fetch_latency.percentile(0.5),
+    ),
+    IRegulPerformanceSensorEntityDescription(
+        key="fetch_latency_p95",
+        translation_key="fetch_latency_p95",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=3,
+        value_fn=lambda coordinator: coordinator.recent_fetch_latency.percentile(0.95),
+    ),
+    IRegulPerformanceSensorEntityDescription(
+        key="frame_items",
+        translation_key="frame_items",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_frame_item_count,
+    ),
+    IRegulPerformanceSensorEntityDescription(
+        key="duplicate_frame_rate",
+        translation_key="duplicate_frame_rate",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=0,
+        value_fn=lambda coordinator: _scaled(coordinator.recent_duplicates.mean(), 100),
+    ),
+    IRegulPerformanceSensorEntityDescription(
+        key="state_writes_per_refresh",
+        translation_key="state_writes_per_refresh",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda coordinator: coordinator.recent_writes_per_update.mean(),
+    ),
+    IRegulPerformanceSensorEntityDescription(
+        key="suppressed_writes",
+        translation_key="suppressed_writes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.suppressed_writes,
+    ),
+    IRegulPerformanceSensorEntityDescription(
+        key="callback_time",
+        translation_key="callback_time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=2,
+        value_fn=lambda coordinator: _scaled(coordinator.recent_callback_time.mean(), 1000),
+    ),
+)
+
+
+class IRegulPerformanceSensor(IRegulBaseEntity, SensorEntity):
+    """Diagnostic sensor showing how the integration performs for a device.
+
+    Values come from rolling windows over the recent refreshes of the coordinator.
+    """
+
+    entity_description: IRegulPerformanceSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        *,
+        coordinator: IRegulCoordinator,
+        entry: ConfigEntry,
+        description: IRegulPerformanceSensorEntityDescription,
+    ) -> None:
+        """Initialize the performance sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        device_id = entry.data[CONF_DEVICE_ID]
+        self._attr_unique_id = f"{device_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device_id)},
+            name=entry.title,
+            manufacturer="IRegul",
+            serial_number=device_id,
+        )
+        self._attr_native_value = description.value_fn(coordinator)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Read the statistic again from the coordinator."""
+        # Written directly so diagnostics do not count in the state write statistics
+        self._attr_native_value = self.entity_description.value_fn(self.coordinator)
         self.async_write_ha_state()
 
 
 class IRegulSensor(IRegulEntity, SensorEntity):
     """Base class for IRegul sensors with shared behavior."""
 
+    _unit_resolved = False
+    _raw_unit: str | None = None
+
+    def _apply_unit(self, unit: str | None) -> None:
+        """Apply unit configuration, resolving it only when the raw unit changes."""
+        if self._unit_resolved and unit == self._raw_unit:
+            return
+        self._unit_resolved = True
+        self._raw_unit = unit
+
+        # Get device class, state class, and unit from configuration
+        device_class, state_class, unit_of_measurement = get_unit_config(unit)
+        self._attr_device_class = device_class
+        self._attr_state_class = state_class
+        self._attr_native_unit_of_measurement = unit_of_measurement or unit
+
     def _apply_type_unit_config(self, sensor_type: int | None) -> None:
         """Apply unit configuration based on sensor type.
 
@@ -229,11 +308,7 @@ class IRegulSensor(IRegulEntity, SensorEntity):
         if sensor_type is None or sensor_type not in (2, 3):
             return
 
-        unit = PERCENTAGE if sensor_type == 2 else None
-        device_class, state_class, unit_of_measurement = get_unit_config(unit)
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
-        self._attr_native_unit_of_measurement = unit_of_measurement
+        self._apply_unit(PERCENTAGE if sensor_type == 2 else None)
 
 
 class IRegulMeasurementSensor(IRegulSensor):
@@ -259,20 +334,13 @@ class IRegulMeasurementSensor(IRegulSensor):
     def _update(self, measurement: Measurement) -> None:
         """Refresh attributes from the latest measurement."""
         self._attr_name = measurement.alias or f"Measurement {measurement.index}"
-
-        # Get device class, state class, and unit from configuration
-        device_class, state_class, unit_of_measurement = get_unit_config(measurement.unit)
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
-        self._attr_native_unit_of_measurement = unit_of_measurement or measurement.unit
+        self._apply_unit(measurement.unit)
         self._attr_native_value = measurement.valeur
 
 
-class IRegulMergedMeasurementSensor(CoordinatorEntity[IRegulCoordinator], SensorEntity):
+class IRegulMergedMeasurementSensor(IRegulBaseEntity, SensorEntity):
     """Merged measurement sensor for duplicate aliases with compatible units."""
 
-    _attr_has_entity_name = True
-
     def __init__(
         self,
         *,
@@ -285,8 +353,7 @@ class IRegulMergedMeasurementSensor(CoordinatorEntity[IRegulCoordinator], Sensor
         super().__init__(coordinator)
         device_id = entry.data[CONF_DEVICE_ID]
         # Unique ID based on device and alias+unit
-        merge_key = f"{alias.strip().lower()}|{canonical_unit or ''}"
-        self._attr_unique_id = f"{device_id}_measurement_merged_{merge_key}"
+        self._attr_unique_id = f"{device_id}_measurement_merged_{merge_key(alias, canonical_unit)}"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, device_id)},
             name=entry.title,
@@ -309,15 +376,12 @@ class IRegulMergedMeasurementSensor(CoordinatorEntity[IRegulCoordinator], Sensor
         """Compute the sum of measurements matching alias and unit."""
         total: float = 0.0
         found = False
-        for m in self.coordinator.data.measurements.values():
-            alias = m.alias or f"Measurement {m.index}"
-            if alias != self._alias:
-                continue
-            c_unit, factor = canonicalize_unit(m.unit)
-            if c_unit != self._canonical_unit:
-                # Skip units that aren't compatible with this merged sensor
-                continue
-            if m.valeur is None:
+        measurements = self.coordinator.data.measurements
+        # Members and their canonical factors are resolved once per frame by the coordinator
+        members = self.coordinator.measurement_groups.get((self._alias, self._canonical_unit), ())
+        for m_id, factor in members:
+            m = measurements.get(m_id)
+            if m is None or m.valeur is None:
                 continue
             found = True
             total += float(m.valeur) * factor
@@ -329,7 +393,10 @@ class IRegulMergedMeasurementSensor(CoordinatorEntity[IRegulCoordinator], Sensor
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator by recomputing the sum."""
-        self._attr_native_value = self._compute_sum()
+        value = self._compute_sum()
+        if self._async_state_unchanged((self.available, value)):
+            return
+        self._attr_native_value = value
         self.async_write_ha_state()
 
 
@@ -410,10 +477,5 @@ class IRegulAnalogSensorSensor(IRegulSensor):
     def _update(self, analog_sensor: AnalogSensor) -> None:
         """Refresh attributes from the latest analog sensor."""
         self._attr_name = analog_sensor.alias or f"Analog Sensor {analog_sensor.index}"
-
-        # Get device class, state class, and unit from configuration
-        device_class, state_class, unit_of_measurement = get_unit_config(analog_sensor.unit)
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
-        self._attr_native_unit_of_measurement = unit_of_measurement or analog_sensor.unit
+        self._apply_unit(analog_sensor.unit)
         self._attr_native_value = analog_sensor.valeur
@@ -0,0 +1,66 @@
+"""Services for the IRegul integration."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_DEVICE_ID, DOMAIN
+from .coordinator import IRegulCoordinator
+
+SERVICE_PROFILE = "profile"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_CYCLES = "cycles"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the IRegul services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def _async_profile(call: ServiceCall) -> ServiceResponse:
+    """Profile the next refresh cycles of a config entry."""
+    hass = call.hass
+    entry = hass.config_entries.async_get_entry(call.data[ATTR_CONFIG_ENTRY_ID])
+    if entry is None or entry.domain != DOMAIN or entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError("The config entry is not a loaded IRegul entry")
+
+    # Only one cProfile profiler can be active in the process at a time
+    for other in hass.config_entries.async_loaded_entries(DOMAIN):
+        other_coordinator: IRegulCoordinator = other.runtime_data
+        if other_coordinator.profiling:
+            raise ServiceValidationError(f"Refreshes of {other.title} are already being profiled")
+
+    coordinator: IRegulCoordinator = entry.runtime_data
+    if coordinator.streaming:
+        raise ServiceValidationError(
+            f"{entry.title} receives pushed frames and has no refresh cycles to profile"
+        )
+    timestamp = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
+    path = hass.config.path(f"{DOMAIN}_{entry.data[CONF_DEVICE_ID]}_{timestamp}.prof")
+    coordinator.async_start_profiling(call.data[ATTR_CYCLES], path)
+    return {"path": path}
@@ -0,0 +1,110 @@
+"""Coalesce concurrent calls to an IRegul API client."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from aioiregul.iregulapi import IRegulApiInterface
+from aioiregul.models import MappedFrame
+
+
+@dataclass(slots=True)
+class _Flight:
+    """Request in flight and the number of callers waiting for it."""
+
+    task: asyncio.Task[Any]
+    waiters: int = 0
+
+
+class SingleFlightClient(IRegulApiInterface):
+    """Share in-flight reads of a client between concurrent callers.
+
+    Callers of get_data or check_auth arriving while the same call is in
+    flight wait for that request and get its result or error, instead of
+    sending their own. A frame fetched less than min_gap seconds ago is
+    returned as is, so bursts of refreshes cost a single fetch. The request
+    is only cancelled when every caller waiting for it was cancelled.
+    Defrost has a side effect and always reaches the device.
+    """
+
+    def __init__(
+        self,
+        client: IRegulApiInterface,
+        *,
+        min_gap: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the wrapper around a client."""
+        self.client = client
+        self.min_gap = min_gap
+        self._clock = clock
+        self._flights: dict[str, _Flight] = {}
+        self._last_frame: MappedFrame | None = None
+        self._last_fetch = 0.0
+        self.requests = 0
+        self.shared_calls = 0
+
+    async def _async_join[T](self, name: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Wait for the call in flight under name, starting it if there is none."""
+        flight = self._flights.get(name)
+        if flight is None:
+            self.requests += 1
+            flight = self._flights[name] = _Flight(asyncio.ensure_future(call()))
+
+            def _forget(_task: asyncio.Task[Any]) -> None:
+                if self._flights.get(name) is flight:
+                    del self._flights[name]
+
+            flight.task.add_done_callback(_forget)
+        else:
+            self.shared_calls += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1:
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    async def _async_fetch(self) -> MappedFrame | None:
+        """Fetch a frame and remember when it was received."""
+        frame = await self.client.get_data()
+        if frame:
+            self._last_frame = frame
+            self._last_fetch = self._clock()
+        return frame
+
+    async def get_data(self) -> MappedFrame | None:
+        """Return the recent frame, or the frame of the fetch in flight."""
+        if self._last_frame is not None and self._clock() - self._last_fetch < self.min_gap:
+            self.shared_calls += 1
+            return self._last_frame
+        return await self._async_join("get_data", self._async_fetch)
+
+    async def check_auth(self) -> bool:
+        """Return the result of the authentication check in flight."""
+        return await self._async_join("check_auth", self.client.check_auth)
+
+    async def defrost(self) -> bool:
+        """Trigger a defrost."""
+        return await self.client.defrost()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the call counters for diagnostics."""
+        return {"requests": self.requests, "shared_calls": self.shared_calls}
+
+
+def unwrap_client(client: IRegulApiInterface) -> IRegulApiInterface:
+    """Return the client wrapped by a SingleFlightClient, or the client itself.
+
+    Hedged fetches use it on purpose to send a new request instead of joining
+    the slow one in flight.
+    """
+    return client.client if isinstance(client, SingleFlightClient) else client
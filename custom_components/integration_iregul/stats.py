@@ -0,0 +1,116 @@
+"""Lightweight statistics kept by the IRegul coordinator."""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections import deque
+from typing import Any
+
+# Upper bounds (seconds) of the fetch latency histogram buckets; slower fetches
+# land in an overflow bucket
+LATENCY_BUCKETS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+# Number of recent samples kept by rolling windows
+ROLLING_WINDOW_SIZE = 100
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of latencies in seconds.
+
+    Recording a value is a bisect and two additions, so it can run on every
+    fetch. Percentiles are estimated with the upper bound of the bucket they
+    fall in, capped by the largest value seen.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize an empty histogram."""
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last: float | None = None
+        self.timeouts = 0
+
+    def record(self, seconds: float) -> None:
+        """Record a completed operation."""
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.last = seconds
+
+    def record_timeout(self) -> None:
+        """Record an operation cancelled by its timeout."""
+        self.timeouts += 1
+
+    def percentile(self, quantile: float) -> float | None:
+        """Return the estimated latency under which the quantile of values falls."""
+        if not self.count:
+            return None
+        rank = max(math.ceil(quantile * self.count), 1)
+        seen = 0
+        for bound, bucket_count in zip(self.buckets, self.counts, strict=False):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        return {
+            "count": self.count,
+            "timeouts": self.timeouts,
+            "last": self.last,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.max if self.count else None,
+            "buckets": {
+                **{
+                    f"le_{bound:g}": count
+                    for bound, count in zip(self.buckets, self.counts, strict=False)
+                },
+                "le_inf": self.counts[-1],
+            },
+        }
+
+
+class RollingWindow:
+    """Most recent samples of a value, for statistics over recent refreshes.
+
+    Adding a sample is O(1); statistics are computed when read, which happens
+    at most once per refresh for each diagnostic sensor.
+    """
+
+    def __init__(self, size: int = ROLLING_WINDOW_SIZE) -> None:
+        """Initialize an empty window."""
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def add(self, value: float) -> None:
+        """Add a sample, dropping the oldest one when the window is full."""
+        self._samples.append(value)
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self._samples)
+
+    @property
+    def last(self) -> float | None:
+        """Return the most recent sample."""
+        return self._samples[-1] if self._samples else None
+
+    def mean(self) -> float | None:
+        """Return the mean of the samples."""
+        if not self._samples:
+            return None
+        return sum(self._samples) / len(self._samples)
+
+    def percentile(self, quantile: float) -> float | None:
+        """Return the nearest-rank percentile of the samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[max(math.ceil(quantile * len(ordered)), 1) - 1]
@@ -0,0 +1,84 @@
+"""Long-lived v2 connections receiving the frames pushed by IRegul devices."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import replace
+
+from aioiregul.models import MappedFrame
+from aioiregul.v2 import decode_text, map_frame
+from aioiregul.v2.client import IRegulClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# Shortest wait before reconnecting, whatever the retry policies and schedule allow
+STREAM_MIN_RECONNECT_SECONDS = 1.0
+
+
+class FrameStream:
+    """Single connection to the v2 endpoint reading every frame it sends.
+
+    The request goes through the client, as a 501 values request once the
+    client holds the configuration skeleton of the device and a full 502
+    request otherwise; values are merged into the skeleton like the client
+    does for polled frames. Every NEW frame received afterwards is yielded,
+    while OLD snapshots and empty keepalive frames are skipped. The iteration
+    ends when the server closes the connection.
+    """
+
+    def __init__(self, client: IRegulClient) -> None:
+        """Initialize the stream of a client."""
+        self._client = client
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def async_open(self) -> None:
+        """Connect and send the request, within the timeout of the client."""
+        command = "501" if self._client.config_skeleton is not None else "502"
+        # The client has no public way to keep a connection open; its own
+        # helper still handles connecting and authenticating the request
+        self._reader, self._writer = await self._client._send_command(command)
+
+    async def frames(self, idle_timeout: float) -> AsyncIterator[MappedFrame]:
+        """Yield the frames received until the server closes the connection.
+
+        Raises TimeoutError when nothing, not even a keepalive, is received for
+        idle_timeout seconds.
+        """
+        if self._reader is None:
+            raise ConnectionError("Stream is not open")
+        client = self._client
+        while True:
+            try:
+                async with asyncio.timeout(idle_timeout):
+                    raw = await self._reader.readuntil(b"}")
+            except asyncio.IncompleteReadError as err:
+                if err.partial.strip():
+                    raise ValueError(f"Incomplete frame from device: {err}") from err
+                return
+            except asyncio.LimitOverrunError as err:
+                raise ValueError(f"Frame too large: {err}") from err
+
+            text = raw.decode("utf-8").strip()
+            if text.startswith("OLD"):
+                continue
+            decoded = await decode_text(text)
+            if decoded.is_keepalive:
+                _LOGGER.debug("Keepalive from device %s", client.device_id)
+                continue
+            if client.config_skeleton is None:
+                client.config_skeleton = {}
+            groups = client._merge_values_into_skeleton(client.config_skeleton, decoded.groups)
+            yield map_frame(replace(decoded, groups=groups))
+
+    async def async_close(self) -> None:
+        """Close the connection."""
+        writer, self._writer, self._reader = self._writer, None, None
+        if writer is None:
+            return
+        writer.close()
+        with contextlib.suppress(ConnectionError):
+            await writer.wait_closed()
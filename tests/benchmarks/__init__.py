@@ -0,0 +1,277 @@
+"""Micro-benchmarks of the IRegul integration hot paths.
+
+Run them from the repository root with ``python -m tests.benchmarks``. Each
+benchmark drives a real IRegulCoordinator inside a Home Assistant instance,
+so frames go through the same processing as received ones.
+
+``--update`` records the results in baseline.json next to this file, and
+``--compare`` fails on results slower than the baseline beyond ``--tolerance``.
+Baseline times are scaled by a calibration loop timed on both machines, so the
+committed baseline can be compared anywhere; raise the tolerance on a busy
+machine, where timings vary more.
+"""
+
+from __future__ import annotations
+
+import platform
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+from datetime import timedelta
+from itertools import count
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from aioiregul.models import MappedFrame
+from custom_components.integration_iregul import binary_sensor, sensor
+from custom_components.integration_iregul.const import (
+    API_VERSION_V2,
+    CONF_API_VERSION,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_PASSWORD,
+    canonicalize_unit,
+    get_unit_config,
+)
+from custom_components.integration_iregul.coordinator import IRegulCoordinator
+from custom_components.integration_iregul.discovery import IRegulDiscovery
+from custom_components.integration_iregul.entity import IRegulEntity
+from custom_components.integration_iregul.sensor import IRegulMergedMeasurementSensor
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+
+from .frames import START, synthetic_frame
+
+SIZES = (10, 100, 1000, 10000)
+BASELINE = Path(__file__).with_name("baseline.json")
+# Relative slowdown over the baseline reported as a regression
+DEFAULT_TOLERANCE = 0.3
+# Shortest timing run; calls are repeated until a run lasts at least this long
+MIN_RUN_SECONDS = 0.2
+
+DEVICE_DATA = {
+    CONF_API_VERSION: API_VERSION_V2,
+    CONF_DEVICE_ID: "SN000000",
+    CONF_DEVICE_PASSWORD: "benchmark",
+}
+
+type Bench = Callable[[], Awaitable[None]]
+
+
+async def _async_coordinator(hass: HomeAssistant, frame: MappedFrame) -> IRegulCoordinator:
+    """Return a coordinator that received a first frame and never polls."""
+    coordinator = IRegulCoordinator(hass, DEVICE_DATA)
+    # Benchmarks hand frames over themselves; a scheduled refresh would reach the network
+    coordinator.update_interval = None
+    coordinator.data = await coordinator._async_process_frame(frame)
+    return coordinator
+
+
+async def _async_setup_platforms(
+    hass: HomeAssistant,
+    coordinator: IRegulCoordinator,
+    add_entities: Callable[[list[Entity]], None],
+) -> dict[Platform, Callable[..., None]]:
+    """Set up both platforms and return the discovery handler each one registered."""
+    handlers: dict[Platform, Callable[..., None]] = {}
+    discovery = coordinator.discovery
+    coordinator.discovery = SimpleNamespace(
+        async_add_platform=lambda platform, handler: handlers.setdefault(platform, handler)
+    )
+    entry = SimpleNamespace(
+        data=DEVICE_DATA,
+        title="IRegul",
+        runtime_data=coordinator,
+        async_on_unload=lambda unsub: None,
+    )
+    for module in (sensor, binary_sensor):
+        await module.async_setup_entry(hass, entry, add_entities)
+    coordinator.discovery = discovery
+    return handlers
+
+
+async def _async_create_entities(
+    hass: HomeAssistant, coordinator: IRegulCoordinator
+) -> list[Entity]:
+    """Return every entity built from the current frame, with state writes disabled."""
+    entities: list[Entity] = []
+    handlers = await _async_setup_platforms(hass, coordinator, entities.extend)
+    for entity_platform, handler in handlers.items():
+        coordinator.discovery.async_add_platform(entity_platform, handler)
+    for entity in entities:
+        entity.async_write_ha_state = lambda: None
+    return entities
+
+
+async def bench_discovery(hass: HomeAssistant, size: int) -> Bench:
+    """Discover a frame and build its sensor entities, as on the first refresh."""
+    coordinator = await _async_coordinator(hass, synthetic_frame(size))
+    handlers = await _async_setup_platforms(hass, coordinator, lambda entities: None)
+    handler = handlers[Platform.SENSOR]
+
+    async def run() -> None:
+        coordinator.discovery = IRegulDiscovery(coordinator)
+        remove_platform = coordinator.discovery.async_add_platform(Platform.SENSOR, handler)
+        remove_platform()
+
+    return run
+
+
+async def _async_bench_entity_update(hass: HomeAssistant, size: int, *, changed: bool) -> Bench:
+    """Process a new frame and fan it out to every item entity.
+
+    Every frame is newer than the last one, so none is skipped as a duplicate;
+    when changed, frames alternate between two sets of values.
+    """
+    first = synthetic_frame(size)
+    frames = (first, synthetic_frame(size, offset=1) if changed else first)
+    coordinator = await _async_coordinator(hass, first)
+    entities = [
+        entity
+        for entity in await _async_create_entities(hass, coordinator)
+        if isinstance(entity, IRegulEntity)
+    ]
+    received = count(1)
+
+    async def run() -> None:
+        index = next(received)
+        frame = replace(frames[index % 2], timestamp=START + timedelta(seconds=index))
+        coordinator.data = await coordinator._async_process_frame(frame)
+        for entity in entities:
+            entity._handle_coordinator_update()
+
+    return run
+
+
+async def bench_entity_update_changed(hass: HomeAssistant, size: int) -> Bench:
+    """Update every item entity with new values."""
+    return await _async_bench_entity_update(hass, size, changed=True)
+
+
+async def bench_entity_update_unchanged(hass: HomeAssistant, size: int) -> Bench:
+    """Update every item entity with the values they already show."""
+    return await _async_bench_entity_update(hass, size, changed=False)
+
+
+async def bench_merged_sum(hass: HomeAssistant, size: int) -> Bench:
+    """Compute the value of every merged measurement sensor."""
+    coordinator = await _async_coordinator(hass, synthetic_frame(size))
+    merged = [
+        entity
+        for entity in await _async_create_entities(hass, coordinator)
+        if isinstance(entity, IRegulMergedMeasurementSensor)
+    ]
+
+    async def run() -> None:
+        for entity in merged:
+            entity._compute_sum()
+
+    return run
+
+
+def _frame_units(size: int) -> list[str]:
+    """Return the raw unit of every measurement and analog sensor of a frame."""
+    frame = synthetic_frame(size)
+    return [item.unit for item in (*frame.measurements.values(), *frame.analog_sensors.values())]
+
+
+async def bench_get_unit_config(hass: HomeAssistant, size: int) -> Bench:
+    """Resolve the sensor configuration of every unit in a frame."""
+    units = _frame_units(size)
+
+    async def run() -> None:
+        for unit in units:
+            get_unit_config(unit)
+
+    return run
+
+
+async def bench_canonicalize_unit(hass: HomeAssistant, size: int) -> Bench:
+    """Canonicalize every unit in a frame."""
+    units = _frame_units(size)
+
+    async def run() -> None:
+        for unit in units:
+            canonicalize_unit(unit)
+
+    return run
+
+
+BENCHMARKS: dict[str, Callable[[HomeAssistant, int], Awaitable[Bench]]] = {
+    "discovery": bench_discovery,
+    "entity_update_changed": bench_entity_update_changed,
+    "entity_update_unchanged": bench_entity_update_unchanged,
+    "merged_sum": bench_merged_sum,
+    "get_unit_config": bench_get_unit_config,
+    "canonicalize_unit": bench_canonicalize_unit,
+}
+
+
+async def _async_calibration() -> None:
+    """Run a fixed pure Python workload measuring the speed of the interpreter."""
+    values = {index: index * 0.5 for index in range(1000)}
+    sum(value for value in values.values() if value > 10)
+
+
+async def _async_time(run: Bench, number: int) -> float:
+    """Return the seconds taken by number calls."""
+    started = time.perf_counter()
+    for _ in range(number):
+        await run()
+    return time.perf_counter() - started
+
+
+async def async_measure(run: Bench, repeat: int) -> float:
+    """Return the best time in seconds of a call over repeat timing runs."""
+    number = 1
+    while await _async_time(run, number) < MIN_RUN_SECONDS:
+        number *= 2
+    return min([await _async_time(run, number) for _ in range(repeat)]) / number
+
+
+async def async_run_benchmarks(
+    hass: HomeAssistant, names: list[str], sizes: list[int], repeat: int
+) -> dict[str, Any]:
+    """Run the benchmarks and return the results in the baseline format.
+
+    The calibration is sampled before every benchmark and its best time kept,
+    so a busy moment of the machine does not skew the comparison.
+    """
+    results: dict[str, dict[str, float]] = {}
+    calibration = float("inf")
+    for name in names:
+        calibration = min(calibration, await async_measure(_async_calibration, repeat))
+        results[name] = {
+            str(size): await async_measure(await BENCHMARKS[name](hass, size), repeat)
+            for size in sizes
+        }
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "calibration": calibration,
+        "results": results,
+    }
+
+
+def find_regressions(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Return a description of every result slower than the baseline beyond tolerance.
+
+    Baseline results are scaled by the ratio of the calibration times, so a
+    baseline recorded on another machine still points at slower code.
+    """
+    scale = current["calibration"] / baseline["calibration"]
+    regressions: list[str] = []
+    for name, sizes in current["results"].items():
+        for size, seconds in sizes.items():
+            reference = baseline["results"].get(name, {}).get(size)
+            if reference is None:
+                continue
+            expected = reference * scale
+            if seconds > expected * (1 + tolerance):
+                regressions.append(
+                    f"{name}[{size}]: {seconds * 1e6:.1f}us, baseline {expected * 1e6:.1f}us"
+                )
+    return regressions
@@ -0,0 +1,66 @@
+"""Run the IRegul micro-benchmarks and compare them with a recorded baseline."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import (
+    BASELINE,
+    BENCHMARKS,
+    DEFAULT_TOLERANCE,
+    SIZES,
+    async_run_benchmarks,
+    find_regressions,
+)
+
+
+async def _async_run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the benchmarks in a Home Assistant instance using a throwaway config dir."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            return await async_run_benchmarks(
+                hass, args.benchmark or list(BENCHMARKS), args.size or list(SIZES), args.repeat
+            )
+        finally:
+            await hass.async_stop(force=True)
+
+
+def main() -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--benchmark", action="append", choices=list(BENCHMARKS))
+    parser.add_argument("--size", action="append", type=int)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--update", action="store_true", help="record the results as baseline")
+    mode.add_argument("--compare", action="store_true", help="fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    current = asyncio.run(_async_run(args))
+    print(json.dumps(current, indent=2))
+
+    if args.update:
+        args.baseline.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        return 0
+    if args.compare:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if regressions := find_regressions(current, baseline, args.tolerance):
+            print("Regressions:", *regressions, sep="\n", file=sys.stderr)
+            return 1
+        print("No regression beyond the tolerance", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
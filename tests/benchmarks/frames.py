@@ -0,0 +1,77 @@
+"""Synthetic IRegul frames for benchmarks."""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, datetime, timedelta
+
+from aioiregul.models import AnalogSensor, Input, MappedFrame, Measurement, Output
+
+# Raw units found in frames, known and unknown to the unit map
+UNITS = ("°C", "°", "kW", "W", "kWh", "Wh", "%", "bar", "V", "l/h", "Hz", "tr/min", "")
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def synthetic_frame(
+    items: int,
+    *,
+    aliases_per_item: float = 0.2,
+    seed: int = 0,
+    offset: int = 0,
+) -> MappedFrame:
+    """Build a frame with about items entries split across the item categories.
+
+    Aliases are drawn from a pool of items * aliases_per_item names, so most of
+    them are shared by several items. The offset shifts the timestamp and values,
+    giving a frame with the same structure but new values.
+    """
+    rng = random.Random(seed)
+    aliases = [f"Alias {index}" for index in range(max(int(items * aliases_per_item), 1))]
+    per_category = max(items // 4, 1)
+
+    def _alias() -> str:
+        return rng.choice(aliases)
+
+    def _value() -> float:
+        return round(rng.uniform(-20, 80), 1) + offset
+
+    return MappedFrame(
+        is_old=False,
+        timestamp=START + timedelta(seconds=offset),
+        count=items,
+        zones={},
+        inputs={
+            index: Input(index=index, valeur=(index + offset) % 2, alias=_alias(), type=index % 3)
+            for index in range(per_category)
+        },
+        outputs={
+            index: Output(index=index, valeur=(index + offset) % 2, alias=_alias(), type=index % 3)
+            for index in range(per_category)
+        },
+        measurements={
+            index: Measurement(
+                index=index,
+                valeur=_value(),
+                unit=rng.choice(UNITS),
+                alias=_alias(),
+                type=index % 4,
+            )
+            for index in range(items - 3 * per_category)
+        },
+        parameters={},
+        labels={},
+        modbus_registers={},
+        analog_sensors={
+            index: AnalogSensor(
+                index=index,
+                valeur=_value(),
+                unit=rng.choice(UNITS),
+                alias=_alias(),
+                type=str(index % 3),
+            )
+            for index in range(per_category)
+        },
+        configuration=None,
+        memory=None,
+    )
@@ -2,26 +2,42 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
-from types import SimpleNamespace
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from aioiregul.models import MappedFrame, Measurement
+from homeassistant.util import dt as dt_util
 
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
-@pytest.fixture(autouse=True)
-def mock_iregul_client_calls() -> None:
-    """Mock network calls from the aioiregul client in tests."""
-    frame = SimpleNamespace(
-        timestamp=datetime.now(UTC),
-        measurements={},
+def build_frame(
+    offset_seconds: int = 0, measurements: dict[int, Measurement] | None = None
+) -> MappedFrame:
+    """Build a frame produced offset_seconds from now, empty unless given measurements."""
+    return MappedFrame(
+        is_old=False,
+        timestamp=dt_util.utcnow() + timedelta(seconds=offset_seconds),
+        count=None,
+        zones={},
         inputs={},
         outputs={},
+        measurements=measurements or {},
+        parameters={},
+        labels={},
+        modbus_registers={},
         analog_sensors={},
+        configuration=None,
+        memory=None,
     )
 
+
+@pytest.fixture(autouse=True)
+def mock_iregul_client_calls() -> None:
+    """Mock network calls from the aioiregul client in tests."""
+    frame = build_frame()
+
     with (
         patch(
             "custom_components.integration_iregul.coordinator.IRegulClient.check_auth",
@@ -31,5 +47,7 @@ def mock_iregul_client_calls() -> None:
             "custom_components.integration_iregul.coordinator.IRegulClient.get_data",
             AsyncMock(return_value=frame),
         ),
+        # Let back-to-back refreshes reach the mocked client
+        patch("custom_components.integration_iregul.client_pool.SINGLE_FLIGHT_MIN_GAP", 0),
     ):
         yield
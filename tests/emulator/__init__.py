@@ -0,0 +1,332 @@
+"""Local stand-in for the IRegul v1 HTTP and v2 socket endpoints.
+
+The emulator serves synthetic frames for many devices at once, with
+configurable latency, jitter, error rate and frame size, so the real clients
+and coordinator can be exercised without any network. Point a config entry at
+it through CONF_HOST, e.g. ``localhost:2000``.
+
+v1 clients only speak HTTPS and their cookie jar ignores IP addresses: serve
+v1 with a certificate the client trusts and address it as ``localhost``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+import ssl
+import tempfile
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from html import escape
+from pathlib import Path
+from secrets import token_hex
+from zlib import crc32
+
+from aiohttp import web
+from aioiregul.models import MappedFrame
+
+from ..benchmarks.frames import synthetic_frame
+
+_V2_REQUEST_RE = re.compile(r"cdraminfo(?P<credentials>.*)\{(?P<command>\d+)#\}")
+_SESSION_COOKIE = "PHPSESSID"
+# v1 status pages and the frame items they list
+_V1_PAGES = {
+    "sorties": "outputs",
+    "sondes": "analog_sensors",
+    "entrees": "inputs",
+    "mesures": "measurements",
+}
+# v2 group letters, the frame items they hold and the serialized fields
+_V2_GROUPS = (
+    ("I", "inputs", ("valeur", "alias", "type")),
+    ("O", "outputs", ("valeur", "alias", "type")),
+    ("M", "measurements", ("valeur", "unit", "alias", "type")),
+    ("A", "analog_sensors", ("valeur", "unit", "alias", "type")),
+)
+
+
+@dataclass(slots=True)
+class EmulatorProfile:
+    """Behavior of the emulated endpoints.
+
+    Latency and jitter are in seconds; each answer waits latency plus a uniform
+    random share of jitter. A request fails with probability error_rate by
+    dropping the connection. Devices publish a new frame of about items entries
+    every cadence seconds; with push, v2 frame requests keep their connection
+    open and receive each new frame as it is published.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    items: int = 100
+    cadence: float = 60.0
+    push: bool = False
+
+
+@dataclass(slots=True)
+class EmulatorStats:
+    """Requests served by the emulator."""
+
+    requests: int = 0
+    errors: int = 0
+    rejected_auth: int = 0
+    per_device: dict[str, int] = field(default_factory=dict)
+
+
+def encode_v2_frame(frame: MappedFrame, *, old: bool = False) -> str:
+    """Serialize a frame in the v2 text protocol."""
+    tokens = [
+        f"{group}@{index}&{name}[{value}]"
+        for group, item_key, names in _V2_GROUPS
+        for index, item in getattr(frame, item_key).items()
+        for name in names
+        if (value := getattr(item, name)) is not None
+    ]
+    header = ("OLD" if old else "") + frame.timestamp.strftime("%d/%m/%Y %H:%M:%S")
+    return f"{header}{{{len(tokens)}#{'#'.join(tokens)}}}"
+
+
+def _v1_page(body: str) -> str:
+    """Wrap a v1 page body in a minimal document."""
+    return f"<html><body>{body}</body></html>"
+
+
+class IRegulEmulator:
+    """Serve synthetic frames for many devices over the v1 and v2 protocols."""
+
+    def __init__(
+        self,
+        devices: dict[str, str],
+        profile: EmulatorProfile | None = None,
+        *,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the emulator with a password per device id."""
+        self.devices = devices
+        self.profile = profile or EmulatorProfile()
+        self.stats = EmulatorStats()
+        self._rng = random.Random(seed)
+        # The v2 request concatenates the device id and password
+        self._v2_credentials = {
+            device_id + password: device_id for device_id, password in devices.items()
+        }
+        self._v1_sessions: dict[str, str] = {}
+        self._frames: dict[str, tuple[int, MappedFrame]] = {}
+        self._servers: list[asyncio.AbstractServer] = []
+        self._runners: list[web.AppRunner] = []
+        # Handlers pushing frames to open connections, cancelled on stop
+        self._push_tasks: set[asyncio.Task[None]] = set()
+
+    def frame(self, device_id: str) -> MappedFrame:
+        """Return the frame currently published by a device."""
+        slot = int(datetime.now().timestamp() // self.profile.cadence)
+        cached = self._frames.get(device_id)
+        if cached is not None and cached[0] == slot:
+            return cached[1]
+        frame = synthetic_frame(
+            self.profile.items, seed=crc32(device_id.encode()), offset=slot % 1000
+        )
+        frame = replace(
+            frame,
+            timestamp=datetime.fromtimestamp(slot * self.profile.cadence).replace(microsecond=0),
+        )
+        self._frames[device_id] = (slot, frame)
+        return frame
+
+    async def _async_answer(self, device_id: str) -> bool:
+        """Wait for the emulated latency; return False if the request must fail."""
+        self.stats.requests += 1
+        self.stats.per_device[device_id] = self.stats.per_device.get(device_id, 0) + 1
+        delay = self.profile.latency + self._rng.uniform(0, self.profile.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self._rng.random() < self.profile.error_rate:
+            self.stats.errors += 1
+            return False
+        return True
+
+    async def async_start_v2(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start the v2 socket endpoint and return the port it listens on."""
+        server = await asyncio.start_server(self._async_handle_v2, host, port)
+        self._servers.append(server)
+        return server.sockets[0].getsockname()[1]
+
+    async def _async_handle_v2(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer a v2 command; failures drop the connection."""
+        try:
+            request = (await reader.readuntil(b"}")).decode("utf-8")
+            match = _V2_REQUEST_RE.fullmatch(request)
+            device_id = None if match is None else self._v2_credentials.get(match["credentials"])
+            if match is None or device_id is None:
+                # Unknown credentials: close without answering, like the real endpoint
+                self.stats.rejected_auth += 1
+                return
+            if not await self._async_answer(device_id):
+                return
+            if match["command"] == "203":
+                writer.write(b"{defrost_ok}")
+            else:
+                frame = self.frame(device_id)
+                previous = frame.timestamp - timedelta(seconds=self.profile.cadence)
+                # The device answers with its previous snapshot first, sent empty here
+                writer.write(f"OLD{previous:%d/%m/%Y %H:%M:%S}{{}}".encode())
+                writer.write(encode_v2_frame(frame).encode())
+            await writer.drain()
+            if self.profile.push and match["command"] != "203":
+                await self._async_push_v2(device_id, writer)
+        except asyncio.IncompleteReadError, ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _async_push_v2(self, device_id: str, writer: asyncio.StreamWriter) -> None:
+        """Send each new frame of a device until the connection is closed."""
+        task = asyncio.current_task()
+        assert task is not None
+        self._push_tasks.add(task)
+        try:
+            while True:
+                await asyncio.sleep(self.profile.cadence - time.time() % self.profile.cadence)
+                writer.write(encode_v2_frame(self.frame(device_id)).encode())
+                await writer.drain()
+        finally:
+            self._push_tasks.discard(task)
+
+    async def async_start_v1(
+        self, host: str = "localhost", port: int = 0, ssl_context: ssl.SSLContext | None = None
+    ) -> int:
+        """Start the v1 HTTP endpoint and return the port it listens on."""
+        app = web.Application()
+        app.router.add_get("/modules/login/main.php", self._async_v1_main)
+        app.router.add_post("/modules/login/process.php", self._async_v1_login)
+        app.router.add_post("/modules/i-regul/includes/processform.php", self._async_v1_update)
+        app.router.add_get("/modules/i-regul/index.php", self._async_v1_index)
+        app.router.add_get("/modules/i-regul/index-Etat.php", self._async_v1_status)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, host, port, ssl_context=ssl_context)
+        await site.start()
+        self._runners.append(runner)
+        return runner.addresses[0][1]
+
+    def _v1_device(self, request: web.Request) -> str | None:
+        """Return the device logged in on the request session."""
+        return self._v1_sessions.get(request.cookies.get(_SESSION_COOKIE, ""))
+
+    async def _async_v1_fail_or_wait(self, request: web.Request, device_id: str) -> None:
+        """Wait for the emulated latency, dropping the connection on injected errors."""
+        if not await self._async_answer(device_id):
+            if request.transport is not None:
+                request.transport.close()
+            raise web.HTTPInternalServerError
+
+    async def _async_v1_main(self, request: web.Request) -> web.Response:
+        """Show the home page, with the device button once logged in."""
+        if (device_id := self._v1_device(request)) is None:
+            return web.Response(text=_v1_page("<form></form>"), content_type="text/html")
+        await self._async_v1_fail_or_wait(request, device_id)
+        return web.Response(text=_v1_page('<div id="btn_i-regul"></div>'), content_type="text/html")
+
+    async def _async_v1_login(self, request: web.Request) -> web.Response:
+        """Log a device in and set its session cookie."""
+        form = await request.post()
+        device_id = str(form.get("user", ""))
+        if self.devices.get(device_id) != form.get("pass"):
+            self.stats.rejected_auth += 1
+            return web.Response(text=_v1_page("<form></form>"), content_type="text/html")
+        await self._async_v1_fail_or_wait(request, device_id)
+        session = token_hex(16)
+        self._v1_sessions[session] = device_id
+        response = web.Response(
+            text=_v1_page('<div id="btn_i-regul"></div>'), content_type="text/html"
+        )
+        response.set_cookie(_SESSION_COOKIE, session)
+        return response
+
+    async def _async_v1_update(self, request: web.Request) -> web.Response:
+        """Accept a refresh or defrost request."""
+        if (device_id := self._v1_device(request)) is None:
+            raise web.HTTPFound("/modules/i-regul/index.php?CMD=Error")
+        await self._async_v1_fail_or_wait(request, device_id)
+        raise web.HTTPFound("/modules/i-regul/index.php?CMD=Success")
+
+    async def _async_v1_index(self, request: web.Request) -> web.Response:
+        """Show the page the update requests redirect to."""
+        return web.Response(text=_v1_page(""), content_type="text/html")
+
+    async def _async_v1_status(self, request: web.Request) -> web.Response:
+        """List the items of a category in the status table."""
+        if (device_id := self._v1_device(request)) is None:
+            return web.Response(text=_v1_page("<form></form>"), content_type="text/html")
+        await self._async_v1_fail_or_wait(request, device_id)
+        item_key = _V1_PAGES.get(request.query.get("Etat", ""))
+        rows: list[str] = []
+        if item_key is not None:
+            for item in getattr(self.frame(device_id), item_key).values():
+                rows.append(
+                    f'<tr><td id="ali_td_tbl_etat">{escape(item.alias)}</td>'
+                    f'<td id="val_td_tbl_etat">{item.valeur}</td>'
+                    f'<td id="unit_td_tbl_etat">{escape(getattr(item, "unit", ""))}</td></tr>'
+                )
+        table = f'<table id="tbl_etat">{"".join(rows)}</table>'
+        return web.Response(text=_v1_page(table), content_type="text/html")
+
+    async def async_stop(self) -> None:
+        """Stop every endpoint."""
+        for task in list(self._push_tasks):
+            task.cancel()
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        for runner in self._runners:
+            await runner.cleanup()
+        self._servers.clear()
+        self._runners.clear()
+
+
+def self_signed_ssl_context(hostname: str = "localhost") -> ssl.SSLContext:
+    """Return a server context with a throwaway self-signed certificate."""
+    # Imported here: only needed to serve v1, and provided by Home Assistant
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, hostname)])
+    now = datetime.now()
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=30))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName(hostname)]), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path = Path(directory, "cert.pem")
+        key_path = Path(directory, "key.pem")
+        cert_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+        key_path.write_bytes(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+        context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+def emulated_devices(count: int, prefix: str = "SN") -> dict[str, str]:
+    """Return count device ids with their passwords."""
+    return {f"{prefix}{index:06d}": f"pw{index}" for index in range(count)}
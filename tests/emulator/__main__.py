@@ -0,0 +1,77 @@
+"""Run the IRegul emulator until interrupted."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+
+from . import EmulatorProfile, IRegulEmulator, emulated_devices, self_signed_ssl_context
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def _async_serve(args: argparse.Namespace) -> None:
+    """Serve the emulated devices and log request statistics."""
+    devices = emulated_devices(args.devices)
+    emulator = IRegulEmulator(
+        devices,
+        EmulatorProfile(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            items=args.items,
+            cadence=args.cadence,
+            push=args.push,
+        ),
+        seed=args.seed,
+    )
+    v2_port = await emulator.async_start_v2(args.host, args.v2_port)
+    _LOGGER.info("v2 endpoint on %s:%s", args.host, v2_port)
+    if args.v1_port is not None:
+        v1_port = await emulator.async_start_v1(
+            "localhost", args.v1_port, ssl_context=self_signed_ssl_context()
+        )
+        _LOGGER.info("v1 endpoint on localhost:%s (self-signed certificate)", v1_port)
+    first, *_ = devices.items()
+    _LOGGER.info("%s devices, e.g. id %s with password %s", len(devices), *first)
+    try:
+        while True:
+            await asyncio.sleep(args.report_interval)
+            stats = emulator.stats
+            _LOGGER.info(
+                "%s requests, %s injected errors, %s rejected logins",
+                stats.requests,
+                stats.errors,
+                stats.rejected_auth,
+            )
+    finally:
+        await emulator.async_stop()
+
+
+def main() -> None:
+    """Parse the command line and run the emulator."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--devices", type=int, default=100)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--v2-port", type=int, default=2000)
+    parser.add_argument("--v1-port", type=int, help="also serve v1 over HTTPS on this port")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--cadence", type=float, default=60.0)
+    parser.add_argument(
+        "--push", action="store_true", help="push new v2 frames to open connections"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report-interval", type=float, default=30.0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_async_serve(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""Smoke tests of the IRegul micro-benchmarks."""
+
+from __future__ import annotations
+
+import pytest
+
+from .benchmarks import BENCHMARKS, find_regressions
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+async def test_benchmark_runs(hass, name):
+    """Test every benchmark runs at a tiny size, so they cannot rot unnoticed."""
+    run = await BENCHMARKS[name](hass, 4)
+    await run()
+    await run()
+
+
+def test_regressions_are_scaled_by_calibration():
+    """Test a baseline from a faster machine only flags code slower beyond the tolerance."""
+    baseline = {"calibration": 1.0, "results": {"discovery": {"10": 1.0, "100": 1.0}}}
+    current = {"calibration": 2.0, "results": {"discovery": {"10": 2.4, "100": 2.8}}}
+
+    assert find_regressions(current, baseline, tolerance=0.3) == [
+        "discovery[100]: 2800000.0us, baseline 2000000.0us"
+    ]
@@ -0,0 +1,96 @@
+"""Tests for the IRegul client pool."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from custom_components.integration_iregul.client_pool import (
+    CLIENT_LINGER_SECONDS,
+    ClientKey,
+    HostLimit,
+    async_get_client_pool,
+)
+from custom_components.integration_iregul.const import API_VERSION_V2
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_client_is_shared_until_last_release(hass):
+    """Test clients are shared per key and dropped after the last release."""
+    pool = async_get_client_pool(hass)
+    key = ClientKey(API_VERSION_V2, None, "SN123456", "secret")
+    factory = MagicMock(side_effect=lambda session: MagicMock())
+
+    first = pool.async_acquire(key, factory)
+    second = pool.async_acquire(key, factory)
+    assert first is second
+    assert factory.call_count == 1
+    # v2 clients do not use an HTTP session
+    assert factory.call_args.args[0] is None
+
+    await pool.async_release(key)
+    assert pool.async_acquire(key, factory) is first
+
+    await pool.async_release(key)
+    await pool.async_release(key, linger=False)
+    assert pool.async_acquire(key, factory) is not first
+    assert factory.call_count == 2
+
+
+async def test_released_client_lingers_for_reuse(hass):
+    """Test a released client is reused until the linger delay expires."""
+    pool = async_get_client_pool(hass)
+    key = ClientKey(API_VERSION_V2, None, "SN123456", "secret")
+    factory = MagicMock(side_effect=lambda session: MagicMock())
+
+    client = pool.async_acquire(key, factory)
+    await pool.async_release(key)
+    assert pool.async_acquire(key, factory) is client
+
+    await pool.async_release(key)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=CLIENT_LINGER_SECONDS + 1))
+    await hass.async_block_till_done()
+
+    assert pool.async_acquire(key, factory) is not client
+
+
+async def test_host_limit_is_shared_per_host(hass):
+    """Test entries targeting the same host share one connection limit."""
+    pool = async_get_client_pool(hass)
+
+    limit = pool.async_host_limit(API_VERSION_V2, "custom.example.com", 2)
+    assert pool.async_host_limit(API_VERSION_V2, None, 2) is not limit
+
+    # A changed limit applies to the users already holding it
+    assert pool.async_host_limit(API_VERSION_V2, "custom.example.com", 8) is limit
+    assert limit.limit == 8
+
+
+async def test_host_limit_change_applies_to_open_connections():
+    """Test a lowered limit takes back freed slots and a raised one frees new slots."""
+    limit = HostLimit(2)
+    await limit.__aenter__()
+    await limit.__aenter__()
+
+    limit.async_set_limit(1)
+    assert limit.locked()
+    waiter = asyncio.create_task(limit.__aenter__())
+    await asyncio.sleep(0)
+
+    # The first slot freed is taken back, the second one goes to the waiter
+    await limit.__aexit__(None, None, None)
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    await limit.__aexit__(None, None, None)
+    await waiter
+    assert limit.locked()
+
+    limit.async_set_limit(2)
+    assert not limit.locked()
+    await limit.__aenter__()
+    assert limit.locked()
@@ -13,12 +13,15 @@ from custom_components.integration_iregul.const import (
     CONF_DEVICE_ID,
     CONF_DEVICE_PASSWORD,
     CONF_HOST,
+    CONF_RACE_CLOUD,
     CONF_SERIAL_NUMBER,
+    CONF_STREAMING,
     CONF_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL_V2,
     DOMAIN,
 )
 from custom_components.integration_iregul.coordinator import IRegulCoordinator
+from custom_components.integration_iregul.singleflight import unwrap_client
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD
 from homeassistant.data_entry_flow import FlowResultType
@@ -289,3 +292,57 @@ async def test_options_flow_requires_host_when_enabled(hass):
 
     assert result["type"] == FlowResultType.FORM
     assert result["errors"] == {"base": "host_required"}
+
+
+async def test_options_flow_rejects_racing_with_streaming(hass):
+    """Test racing the cloud endpoint cannot be combined with streaming."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_API_VERSION: API_VERSION_V2,
+            CONF_DEVICE_ID: "SN123456",
+            CONF_DEVICE_PASSWORD: "secret",
+            CONF_HOST: "custom.example.com",
+        },
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            CONF_PASSWORD: "secret",
+            CONF_UPDATE_INTERVAL: 5,
+            CONF_USE_CUSTOM_HOST: True,
+            CONF_HOST: "custom.example.com",
+            CONF_RACE_CLOUD: True,
+            CONF_STREAMING: True,
+        },
+    )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "race_cloud_exclusive"}
+    assert CONF_RACE_CLOUD not in entry.data
+
+
+async def test_validate_input_hands_client_to_coordinator(hass):
+    """Test the client validated by the flow is reused by the coordinator."""
+    data = {
+        CONF_API_VERSION: API_VERSION_V2,
+        CONF_DEVICE_ID: "SN123456",
+        CONF_DEVICE_PASSWORD: "super-secret",
+    }
+    with patch.object(IRegulCoordinator, "create_client") as mock_create_client:
+        mock_create_client.return_value.check_auth = AsyncMock(return_value=True)
+
+        await __import__(
+            "custom_components.integration_iregul.config_flow",
+            fromlist=["validate_input"],
+        ).validate_input(hass, data)
+
+        coordinator = IRegulCoordinator(hass, data)
+        await coordinator.async_setup()
+
+    assert mock_create_client.call_count == 1
+    assert unwrap_client(coordinator.client) is mock_create_client.return_value
+    await coordinator.async_shutdown()
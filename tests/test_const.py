@@ -0,0 +1,39 @@
+"""Tests for the IRegul unit helpers."""
+
+from __future__ import annotations
+
+from custom_components.integration_iregul.const import (
+    DEFAULT_UNIT_CONFIG,
+    canonicalize_unit,
+    get_unit_config,
+    resolve_unit,
+)
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.const import UnitOfPower, UnitOfTemperature
+
+
+def test_known_unit_is_resolved():
+    """Test units from UNIT_MAP resolve to their configuration and canonical form."""
+    assert get_unit_config("kW") == (
+        SensorDeviceClass.POWER,
+        SensorStateClass.MEASUREMENT,
+        UnitOfPower.KILO_WATT,
+    )
+    assert canonicalize_unit("kW") == (UnitOfPower.WATT, 1000.0)
+    # Units without canonicalization keep their own string
+    assert canonicalize_unit("°F") == ("°F", 1.0)
+    assert get_unit_config("°F")[2] == UnitOfTemperature.FAHRENHEIT
+
+
+def test_unknown_and_missing_units_use_defaults():
+    """Test unknown and missing units fall back to the default configuration."""
+    assert get_unit_config(None) == DEFAULT_UNIT_CONFIG
+    assert canonicalize_unit(None) == (None, 1.0)
+    assert get_unit_config("furlong") == DEFAULT_UNIT_CONFIG
+    assert canonicalize_unit("furlong") == ("furlong", 1.0)
+
+
+def test_resolution_is_memoized():
+    """Test repeated lookups return the same precomputed objects."""
+    assert resolve_unit("kWh") is resolve_unit("kWh")
+    assert resolve_unit("furlong") is resolve_unit("furlong")
@@ -0,0 +1,285 @@
+"""Tests for the IRegul coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aioiregul.models import MappedFrame
+from custom_components.integration_iregul.client_pool import HostLimit
+from custom_components.integration_iregul.const import (
+    API_VERSION_V2,
+    ATTR_FROM_SAVED_FRAME,
+    CONF_API_VERSION,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_PASSWORD,
+    CONF_PHASE_TIMEOUT,
+    DEFAULT_PHASE_TIMEOUT,
+    DOMAIN,
+    FRAME_STORAGE_VERSION,
+)
+from custom_components.integration_iregul.coordinator import IRegulCoordinator
+from custom_components.integration_iregul.polling import HedgePolicy
+from custom_components.integration_iregul.replay import frame_to_dict
+from custom_components.integration_iregul.singleflight import unwrap_client
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from .conftest import build_frame
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.usefixtures("enable_custom_integrations"),
+]
+
+
+async def _async_setup_entry(hass, frames: list[MappedFrame]) -> MockConfigEntry:
+    """Set up a config entry whose client returns the given frames."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="IRegul",
+        data={
+            CONF_API_VERSION: API_VERSION_V2,
+            CONF_DEVICE_ID: "SN123456",
+            CONF_DEVICE_PASSWORD: "secret",
+        },
+    )
+    entry.add_to_hass(hass)
+    with patch(
+        "custom_components.integration_iregul.coordinator.IRegulClient.get_data",
+        AsyncMock(side_effect=frames),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return entry
+
+
+async def test_duplicate_frame_skips_listeners(hass):
+    """Test a frame whose timestamp did not advance is not fanned out."""
+    first = build_frame(0)
+    duplicate = replace(first)
+    newer = build_frame(60)
+    entry = await _async_setup_entry(hass, [first])
+    coordinator = entry.runtime_data
+    listener = MagicMock()
+    entry.async_on_unload(coordinator.async_add_listener(listener))
+
+    with patch(
+        "custom_components.integration_iregul.coordinator.IRegulClient.get_data",
+        AsyncMock(side_effect=[duplicate, newer]),
+    ):
+        await coordinator.async_refresh()
+        assert coordinator.data is first
+        assert coordinator.duplicate_frames == 1
+        listener.assert_not_called()
+
+        await coordinator.async_refresh()
+        assert coordinator.data is newer
+        listener.assert_called_once()
+
+    assert coordinator.polls == 3
+
+
+async def test_stale_timer_marks_entities_unavailable(hass):
+    """Test the stale timer flips availability without any refresh."""
+    entry = await _async_setup_entry(hass, [build_frame(0)])
+    coordinator = entry.runtime_data
+    listener = MagicMock()
+    entry.async_on_unload(coordinator.async_add_listener(listener))
+    assert not coordinator.data_stale
+
+    # Stop polling so only the stale timer can notify listeners
+    coordinator.update_interval = None
+    coordinator._async_unsub_refresh()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + coordinator.stale_threshold + timedelta(seconds=1)
+    )
+    await hass.async_block_till_done()
+
+    assert coordinator.data_stale
+    listener.assert_called_once()
+
+
+async def test_open_circuits_skip_fetches(hass):
+    """Test failed fetches back off the device and an open host circuit sends nothing."""
+    entry = await _async_setup_entry(hass, [build_frame(0)])
+    coordinator = entry.runtime_data
+
+    with patch(
+        "custom_components.integration_iregul.coordinator.IRegulClient.get_data",
+        AsyncMock(side_effect=OSError("unreachable")),
+    ) as get_data:
+        await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+        assert coordinator.diagnostics()["device_retry"]["state"] == "open"
+
+        # Still backing off: the refresh does not reach the client
+        await coordinator.async_refresh()
+        assert get_data.await_count == 1
+
+        # An open host circuit refuses the device even once its own delay elapsed,
+        # without growing the backoff of the device
+        coordinator._retry_policy.open_until = 0.0
+        host_policy = coordinator._host_retry_policy
+        for _ in range(host_policy.failure_threshold):
+            host_policy.record_failure(hass.loop.time())
+        await coordinator.async_refresh()
+        assert get_data.await_count == 1
+        assert coordinator._retry_policy.failures == 1
+        assert coordinator._retry_policy.state == "open"
+        assert coordinator._next_refresh_at(hass.loop.time()) == host_policy.open_until
+
+    # The device probe goes through once the host recovers
+    host_policy.record_success()
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator._retry_policy.failures == 0
+
+
+async def test_fetch_timeout_cancels_hung_fetch(hass):
+    """Test a fetch exceeding its budget fails and is counted as a timeout."""
+    entry = await _async_setup_entry(hass, [build_frame(0)])
+    coordinator = entry.runtime_data
+    assert coordinator.fetch_latency.count == 1
+    coordinator._fetch_timeout = 0.01
+
+    async def _hang():
+        await asyncio.sleep(3600)
+
+    with patch(
+        "custom_components.integration_iregul.coordinator.IRegulClient.get_data",
+        side_effect=_hang,
+    ):
+        await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert coordinator.fetch_latency.timeouts == 1
+    assert coordinator.fetch_latency.count == 1
+
+
+async def test_slow_fetch_is_hedged(hass):
+    """Test a fetch slower than recent ones gets a duplicate request that wins."""
+    entry = await _async_setup_entry(hass, [build_frame(0)])
+    coordinator = entry.runtime_data
+    coordinator._hedge_policy = HedgePolicy(quantile=0.5, budget_ratio=1.0, min_samples=1)
+    coordinator.recent_fetch_latency.add(0.01)
+    newer = build_frame(60)
+    calls = 0
+
+    async def _get_data():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            # The original request hangs until the hedge answers
+            await asyncio.sleep(3600)
+        return newer
+
+    with patch(
+        "custom_components.integration_iregul.coordinator.IRegulClient.get_data",
+        side_effect=_get_data,
+    ):
+        await coordinator.async_refresh()
+
+    assert coordinator.data is newer
+    assert coordinator.diagnostics()["hedging"] == {"hedges": 1, "wins": 1}
+
+
+async def test_saved_frame_is_restored_before_first_fetch(hass, hass_storage):
+    """Test setup starts from the saved frame and the live frame replaces it."""
+    saved = build_frame(-600)
+    hass_storage[f"{DOMAIN}.frame_SN123456"] = {
+        "version": FRAME_STORAGE_VERSION,
+        "key": f"{DOMAIN}.frame_SN123456",
+        "data": frame_to_dict(saved),
+    }
+    live = build_frame(0)
+    release = asyncio.Event()
+
+    async def _get_data():
+        await release.wait()
+        return live
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="IRegul",
+        data={
+            CONF_API_VERSION: API_VERSION_V2,
+            CONF_DEVICE_ID: "SN123456",
+            CONF_DEVICE_PASSWORD: "secret",
+        },
+    )
+    entry.add_to_hass(hass)
+    with (
+        patch(
+            "custom_components.integration_iregul.coordinator.IRegulClient.get_data",
+            side_effect=_get_data,
+        ),
+        patch.object(IRegulCoordinator, "async_start_streaming") as start_streaming,
+    ):
+        # Setup does not wait for the device
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = entry.runtime_data
+        assert coordinator.restored
+        assert coordinator.data == saved
+        entity_id = er.async_get(hass).async_get_entity_id(
+            "sensor", DOMAIN, "SN123456_last_message"
+        )
+        assert hass.states.get(entity_id).attributes[ATTR_FROM_SAVED_FRAME]
+        # The stream waits for the first fetch
+        start_streaming.assert_not_called()
+
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+        start_streaming.assert_called_once()
+
+    assert not coordinator.restored
+    assert coordinator.data is live
+    assert ATTR_FROM_SAVED_FRAME not in hass.states.get(entity_id).attributes
+
+
+async def test_phase_timeout_option_replaces_pooled_client(hass):
+    """Test a new phase timeout is applied on reload instead of reusing the lingering client."""
+    entry = await _async_setup_entry(hass, [build_frame(0)])
+    assert unwrap_client(entry.runtime_data.client).timeout == DEFAULT_PHASE_TIMEOUT
+
+    hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_PHASE_TIMEOUT: 5})
+    with patch(
+        "custom_components.integration_iregul.coordinator.IRegulClient.get_data",
+        AsyncMock(return_value=build_frame(60)),
+    ):
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert unwrap_client(entry.runtime_data.client).timeout == 5
+
+
+async def test_hedge_needs_a_free_host_slot(hass):
+    """Test a slow fetch holding the last connection slot of its host is not hedged."""
+    entry = await _async_setup_entry(hass, [build_frame(0)])
+    coordinator = entry.runtime_data
+    coordinator._hedge_policy = HedgePolicy(quantile=0.5, budget_ratio=1.0, min_samples=1)
+    coordinator.recent_fetch_latency.add(0.01)
+    coordinator._host_limit = HostLimit(1)
+    newer = build_frame(60)
+
+    async def _get_data():
+        await asyncio.sleep(0.05)
+        return newer
+
+    with patch(
+        "custom_components.integration_iregul.coordinator.IRegulClient.get_data",
+        side_effect=_get_data,
+    ) as get_data:
+        await coordinator.async_refresh()
+
+    assert coordinator.data is newer
+    assert get_data.await_count == 1
+    assert coordinator.diagnostics()["hedging"] == {"hedges": 0, "wins": 0}
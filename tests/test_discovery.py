@@ -0,0 +1,62 @@
+"""Tests for the IRegul entity discovery."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from aioiregul.models import AnalogSensor, Input, Measurement, Output
+from custom_components.integration_iregul.discovery import (
+    build_measurement_groups,
+    frame_shape,
+    route_item,
+)
+from homeassistant.const import Platform
+
+
+def test_build_measurement_groups_resolves_canonical_factor():
+    """Test measurements are grouped by alias and canonical unit with their factor."""
+    groups = build_measurement_groups(
+        {
+            1: Measurement(index=1, valeur=1.0, unit="kW", alias="Power"),
+            2: Measurement(index=2, valeur=500.0, unit="W", alias="Power"),
+            3: Measurement(index=3, valeur=2.0, unit="bar", alias="Power"),
+            4: Measurement(index=4, valeur=3.0, unit="°C"),
+        }
+    )
+
+    assert groups[("Power", "W")] == [(1, 1000.0), (2, 1.0)]
+    assert groups[("Power", "bar")] == [(3, 1.0)]
+    assert groups[("Measurement 4", "°C")] == [(4, 1.0)]
+
+
+def test_frame_shape_ignores_values():
+    """Test the frame shape only changes with the frame structure."""
+
+    def _frame(valeur: float, input_type: int) -> SimpleNamespace:
+        return SimpleNamespace(
+            timestamp=datetime.now(UTC),
+            measurements={1: Measurement(index=1, valeur=valeur, unit="°C", alias="Flow")},
+            inputs={1: Input(index=1, valeur=int(valeur), type=input_type)},
+            outputs={},
+            analog_sensors={},
+        )
+
+    assert frame_shape(_frame(20.0, 1)) == frame_shape(_frame(21.0, 1))
+    assert frame_shape(_frame(20.0, 1)) != frame_shape(_frame(20.0, 2))
+
+
+def test_route_item_by_type():
+    """Test items are routed to the binary_sensor platform only for type 1."""
+    assert route_item("inputs", Input(index=1, valeur=1, type=1)) is Platform.BINARY_SENSOR
+    assert route_item("inputs", Input(index=2, valeur=1, type=2)) is Platform.SENSOR
+    assert route_item("outputs", Output(index=1, valeur=0, type=1)) is Platform.BINARY_SENSOR
+    assert (
+        route_item("analog_sensors", AnalogSensor(index=1, valeur=1.0, type="1"))
+        is Platform.BINARY_SENSOR
+    )
+    # Analog sensor types are strings; an integer 1 is not a binary sensor
+    assert (
+        route_item("analog_sensors", AnalogSensor(index=2, valeur=1.0, type=1)) is Platform.SENSOR
+    )
+    assert route_item("measurements", Measurement(index=1, valeur=1.0, type=1)) is Platform.SENSOR
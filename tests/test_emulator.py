@@ -0,0 +1,159 @@
+"""Tests running the IRegul coordinator against the local emulator."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any
+
+import pytest
+from custom_components.integration_iregul.const import (
+    API_VERSION_V2,
+    CONF_API_VERSION,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_PASSWORD,
+    CONF_HOST,
+    CONF_STREAMING,
+    DOMAIN,
+)
+from custom_components.integration_iregul.services import SERVICE_PROFILE
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.exceptions import ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .emulator import EmulatorProfile, IRegulEmulator, emulated_devices
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.usefixtures("enable_custom_integrations", "socket_enabled"),
+]
+
+# Raise to load-test more devices, e.g. IREGUL_EMULATOR_DEVICES=500
+EMULATED_DEVICES = int(os.environ.get("IREGUL_EMULATOR_DEVICES", "20"))
+
+
+@pytest.fixture(autouse=True)
+def mock_iregul_client_calls() -> None:
+    """Let the client reach the emulator instead of mocking it."""
+
+
+def _add_entries(hass, devices: dict[str, str], port: int, **options: Any) -> list[MockConfigEntry]:
+    """Add a config entry per emulated device."""
+    entries: list[MockConfigEntry] = []
+    for device_id, password in devices.items():
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=device_id,
+            data={
+                CONF_API_VERSION: API_VERSION_V2,
+                CONF_DEVICE_ID: device_id,
+                CONF_DEVICE_PASSWORD: password,
+                CONF_HOST: f"127.0.0.1:{port}",
+                **options,
+            },
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+    return entries
+
+
+async def test_coordinators_fetch_from_emulated_devices(hass):
+    """Test many entries set up concurrently against the emulated v2 endpoint."""
+    devices = emulated_devices(EMULATED_DEVICES)
+    emulator = IRegulEmulator(devices, EmulatorProfile(items=40, latency=0.01, jitter=0.02))
+    port = await emulator.async_start_v2()
+    try:
+        entries = _add_entries(hass, devices, port)
+        results = await asyncio.gather(
+            *(hass.config_entries.async_setup(entry.entry_id) for entry in entries)
+        )
+        await hass.async_block_till_done()
+
+        assert all(results)
+        for entry in entries:
+            coordinator = entry.runtime_data
+            assert coordinator.last_update_success
+            assert coordinator.data.measurements.keys() == (
+                emulator.frame(entry.title).measurements.keys()
+            )
+        assert emulator.stats.requests == len(devices)
+    finally:
+        await emulator.async_stop()
+
+
+async def test_dropped_connections_retry_setup(hass):
+    """Test entries retry setup when the emulated endpoint drops every request."""
+    devices = emulated_devices(2)
+    emulator = IRegulEmulator(devices, EmulatorProfile(error_rate=1.0))
+    port = await emulator.async_start_v2()
+    try:
+        entries = _add_entries(hass, devices, port)
+        # Setting up the first entry loads the integration, which sets up every entry
+        assert not await hass.config_entries.async_setup(entries[0].entry_id)
+        await hass.async_block_till_done()
+        for entry in entries:
+            assert entry.state is ConfigEntryState.SETUP_RETRY
+        assert emulator.stats.errors == len(devices)
+    finally:
+        await emulator.async_stop()
+
+
+async def test_streaming_receives_pushed_frames(hass):
+    """Test a streaming entry receives new frames over its open connection."""
+    devices = emulated_devices(1)
+    emulator = IRegulEmulator(devices, EmulatorProfile(items=20, cadence=1.0, push=True))
+    port = await emulator.async_start_v2()
+    try:
+        (entry,) = _add_entries(hass, devices, port, **{CONF_STREAMING: True})
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        coordinator = entry.runtime_data
+
+        async with asyncio.timeout(10):
+            while coordinator.pushed_frames < 2:
+                await asyncio.sleep(0.1)
+
+        assert coordinator.data.measurements.keys() == (
+            emulator.frame(entry.title).measurements.keys()
+        )
+        # The first refresh and a single stream connection
+        assert emulator.stats.requests == 2
+        assert coordinator.diagnostics()["streaming"]["connected"]
+
+        # Pushed frames have no refresh cycle to profile
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_PROFILE,
+                {"config_entry_id": entry.entry_id, "cycles": 1},
+                blocking=True,
+                return_response=True,
+            )
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    finally:
+        await emulator.async_stop()
+
+
+async def test_streaming_falls_back_to_polling(hass):
+    """Test an endpoint closing the connection after its answer is polled instead."""
+    devices = emulated_devices(1)
+    emulator = IRegulEmulator(devices, EmulatorProfile(items=20, cadence=1.0))
+    port = await emulator.async_start_v2()
+    try:
+        (entry,) = _add_entries(hass, devices, port, **{CONF_STREAMING: True})
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        coordinator = entry.runtime_data
+
+        async with asyncio.timeout(10):
+            while not coordinator.stream_fallback or coordinator.streaming:
+                await asyncio.sleep(0.1)
+
+        # The first refresh and the one stream connection that was answered once
+        assert emulator.stats.requests == 2
+        assert coordinator.diagnostics()["streaming"]["fallback_to_polling"]
+        # Polling resumed with the configuration skeleton learned from the first frames
+        assert coordinator._unsub_refresh is not None
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    finally:
+        await emulator.async_stop()
@@ -0,0 +1,123 @@
+"""Tests for the IRegul base entities."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from aioiregul.models import Measurement
+from custom_components.integration_iregul.const import (
+    API_VERSION_V2,
+    CONF_API_VERSION,
+    CONF_DEFERRED_SETUP,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_PASSWORD,
+    DOMAIN,
+)
+from homeassistant.const import STATE_UNAVAILABLE
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .conftest import build_frame
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.usefixtures("enable_custom_integrations"),
+]
+
+
+def _flow(valeur: float) -> dict[int, Measurement]:
+    """Return the single measurement of the test frames."""
+    return {1: Measurement(index=1, valeur=valeur, unit="°C", alias="Flow")}
+
+
+async def test_unchanged_item_skips_state_write(hass):
+    """Test that a refresh with identical item values does not write state again."""
+    frames = [
+        build_frame(0, _flow(21.5)),
+        build_frame(1, _flow(21.5)),
+        build_frame(2, _flow(21.5)),
+        build_frame(3, _flow(22.0)),
+    ]
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="IRegul",
+        data={
+            CONF_API_VERSION: API_VERSION_V2,
+            CONF_DEVICE_ID: "SN123456",
+            CONF_DEVICE_PASSWORD: "secret",
+        },
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.integration_iregul.coordinator.IRegulClient.get_data",
+        AsyncMock(side_effect=frames),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = entry.runtime_data
+
+        # First refresh records the reference signature
+        await coordinator.async_refresh()
+        assert coordinator.suppressed_writes == 0
+
+        # Same value again: the measurement write is suppressed
+        await coordinator.async_refresh()
+        assert coordinator.suppressed_writes == 1
+        # Only the last message sensor wrote its new timestamp
+        assert coordinator.recent_writes_per_update.last == 1
+
+        # New value: the measurement is written
+        await coordinator.async_refresh()
+        assert coordinator.suppressed_writes == 1
+
+    state = hass.states.get("sensor.iregul_flow")
+    assert state is not None
+    assert float(state.state) == 22.0
+
+
+async def test_deferred_setup_recreates_registered_entities(hass, entity_registry):
+    """Test deferred setup creates known entities before the first frame is fetched."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="IRegul",
+        data={
+            CONF_API_VERSION: API_VERSION_V2,
+            CONF_DEVICE_ID: "SN123456",
+            CONF_DEVICE_PASSWORD: "secret",
+            CONF_DEFERRED_SETUP: True,
+        },
+    )
+    entry.add_to_hass(hass)
+    registered = entity_registry.async_get_or_create(
+        "sensor", DOMAIN, "SN123456_measurement_1", config_entry=entry, original_name="Flow"
+    )
+    release = asyncio.Event()
+
+    async def _get_data():
+        await release.wait()
+        return build_frame(0, _flow(21.5))
+
+    with patch(
+        "custom_components.integration_iregul.coordinator.IRegulClient.get_data",
+        side_effect=_get_data,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = entry.runtime_data
+
+        # The placeholder entity exists but has no value yet
+        assert hass.states.get(registered.entity_id).state == STATE_UNAVAILABLE
+        # Its item keeps the missing unit and the shape is recorded for discovery
+        assert coordinator.data.measurements[1].unit is None
+        assert coordinator.frame_shape is not None
+        setup = coordinator.diagnostics()["setup"]
+        assert setup["entry_seconds"] is not None
+        assert setup["first_frame_seconds"] is None
+
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert hass.states.get(registered.entity_id).state == "21.5"
+    assert coordinator.diagnostics()["setup"]["first_frame_seconds"] is not None
@@ -0,0 +1,118 @@
+"""Tests for the IRegul polling policies."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+from custom_components.integration_iregul.polling import (
+    CADENCE_MARGIN_SECONDS,
+    CircuitState,
+    FrameCadence,
+    HedgePolicy,
+    RetryPolicy,
+)
+from custom_components.integration_iregul.stats import RollingWindow
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def test_cadence_is_learned_from_distinct_timestamps():
+    """Test the cadence follows the delay between new frames only."""
+    cadence = FrameCadence()
+
+    assert cadence.observe(START)
+    assert cadence.observe(START + timedelta(seconds=60))
+    # The same frame again does not count as a new frame
+    assert not cadence.observe(START + timedelta(seconds=60))
+
+    assert cadence.cadence == 60.0
+
+
+def test_next_delay_targets_next_frame_within_bounds():
+    """Test the next fetch happens just after the expected frame, within bounds."""
+    cadence = FrameCadence()
+    # Nothing learned yet: poll at the maximum interval
+    assert cadence.next_delay(START, 30, 900) == 900
+
+    cadence.observe(START)
+    cadence.observe(START + timedelta(seconds=120))
+    now = START + timedelta(seconds=130)
+
+    assert cadence.next_delay(now, 30, 900) == 110 + CADENCE_MARGIN_SECONDS
+    assert cadence.next_delay(now, 30, 60) == 60
+    # The expected frame is late: retry at the minimum interval
+    assert cadence.next_delay(START + timedelta(seconds=400), 30, 900) == 30
+
+
+def test_retry_policy_backs_off_exponentially_with_jitter():
+    """Test the backoff doubles per failure, is capped and keeps its upper half jittered."""
+    policy = RetryPolicy(base_delay=60, max_delay=300, rand=lambda: 1.0)
+    delays = []
+    for _ in range(4):
+        policy.record_failure(0.0)
+        delays.append(policy.open_until)
+    assert delays == [60, 120, 240, 300]
+
+    policy = RetryPolicy(base_delay=60, max_delay=300, rand=lambda: 0.0)
+    policy.record_failure(0.0)
+    assert policy.open_until == 30
+
+
+def test_retry_policy_half_open_allows_a_single_probe():
+    """Test the circuit opens at the threshold and lets one probe through once it expires."""
+    policy = RetryPolicy(base_delay=60, max_delay=300, failure_threshold=2, rand=lambda: 1.0)
+    policy.record_failure(0.0)
+    assert policy.allow_request(1.0)
+
+    policy.record_failure(1.0)
+    assert policy.state is CircuitState.OPEN
+    assert not policy.allow_request(100.0)
+
+    # The delay elapsed: a single probe goes through
+    assert policy.allow_request(121.0)
+    assert policy.state is CircuitState.HALF_OPEN
+    assert not policy.allow_request(121.0)
+    assert policy.rejected == 2
+
+    # A failed probe opens the circuit again for longer
+    policy.record_failure(122.0)
+    assert policy.state is CircuitState.OPEN
+    assert policy.open_until == 122.0 + 240
+
+    assert policy.allow_request(400.0)
+    policy.record_success()
+    assert policy.state is CircuitState.CLOSED
+    assert policy.failures == 0
+
+
+def test_retry_policy_refuses_without_taking_the_probe():
+    """Test refuses counts rejections but leaves the probe to allow_request."""
+    policy = RetryPolicy(base_delay=60, max_delay=300, rand=lambda: 1.0)
+    assert not policy.refuses(0.0)
+
+    policy.record_failure(0.0)
+    assert policy.refuses(30.0)
+    assert policy.rejected == 1
+
+    # The delay elapsed: the circuit stays open until the probe is taken
+    assert not policy.refuses(60.0)
+    assert policy.state is CircuitState.OPEN
+    assert policy.allow_request(60.0)
+    assert policy.refuses(60.0)
+
+
+def test_hedge_policy_waits_for_samples_and_budget():
+    """Test hedges need enough latency samples and are capped by the budget."""
+    policy = HedgePolicy(quantile=0.9, budget_ratio=0.5, min_samples=10)
+    latencies = RollingWindow()
+    for latency in range(1, 10):
+        latencies.add(latency)
+    assert policy.delay(latencies) is None
+
+    latencies.add(10)
+    # Half a hedge earned per fetch: every other fetch may be hedged
+    assert policy.delay(latencies) == 9
+    policy.record_hedge()
+    assert policy.delay(latencies) is None
+    assert policy.delay(latencies) == 9
+    assert policy.as_dict() == {"hedges": 1, "wins": 0}
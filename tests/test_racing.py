@@ -0,0 +1,131 @@
+"""Tests for the IRegul racing client."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from custom_components.integration_iregul.polling import RetryPolicy
+from custom_components.integration_iregul.racing import RacePath, RacingClient
+
+
+class _FakeClient:
+    """Client answering after a delay, or failing."""
+
+    def __init__(self, delay: float, frame: object = None, error: Exception | None = None):
+        self.delay = delay
+        self.frame = frame
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+        self.defrosts = 0
+
+    async def get_data(self):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.frame
+
+    async def check_auth(self) -> bool:
+        return self.error is None
+
+    async def defrost(self) -> bool:
+        self.defrosts += 1
+        return True
+
+
+def _racing_client(*paths: RacePath) -> RacingClient:
+    """Build a racing client settling on a leader after two races."""
+    return RacingClient(list(paths), settle_lead=2, probe_every=5)
+
+
+async def test_fastest_path_wins_and_slower_is_cancelled():
+    """Test the first frame is kept and the slower request cancelled."""
+    local = _FakeClient(0.0, SimpleNamespace(source="local"))
+    cloud = _FakeClient(10.0, SimpleNamespace(source="cloud"))
+    client = _racing_client(RacePath("host", local), RacePath("cloud", cloud))
+
+    assert (await client.get_data()).source == "local"
+    assert cloud.cancelled == 1
+    assert client.as_dict()["paths"]["host"]["wins"] == 1
+
+
+async def test_failing_path_falls_back_to_the_other():
+    """Test a failing path leaves the race to the slower one."""
+    local = _FakeClient(0.0, error=ConnectionError("down"))
+    cloud = _FakeClient(0.01, SimpleNamespace(source="cloud"))
+    client = _racing_client(RacePath("host", local), RacePath("cloud", cloud))
+
+    assert (await client.get_data()).source == "cloud"
+    assert client.preferred.name == "cloud"
+
+    # Side effects only go through the preferred path
+    assert await client.defrost()
+    assert (local.defrosts, cloud.defrosts) == (0, 1)
+
+
+async def test_every_path_failing_raises():
+    """Test the error is raised when no path answers."""
+    client = _racing_client(
+        RacePath("host", _FakeClient(0.0, error=ConnectionError("host down"))),
+        RacePath("cloud", _FakeClient(0.01, error=TimeoutError())),
+    )
+
+    with pytest.raises(ConnectionError):
+        await client.get_data()
+    assert not await client.check_auth()
+
+
+async def test_leader_is_used_alone_once_settled():
+    """Test reads stop racing once a path leads, apart from periodic probes."""
+    local = _FakeClient(0.0, SimpleNamespace(source="local"))
+    cloud = _FakeClient(10.0, SimpleNamespace(source="cloud"))
+    client = _racing_client(RacePath("host", local), RacePath("cloud", cloud))
+
+    for _ in range(5):
+        assert (await client.get_data()).source == "local"
+
+    # Two races settled the host path; the fifth read raced again as a probe
+    assert client.leader.name == "host"
+    assert client.races == 3
+    assert cloud.calls == 3
+
+
+async def test_failing_leader_falls_back_to_a_race():
+    """Test a leader failure is answered by the other paths and costs it the lead."""
+    local = _FakeClient(0.0, SimpleNamespace(source="local"))
+    cloud = _FakeClient(0.01, SimpleNamespace(source="cloud"))
+    client = _racing_client(RacePath("host", local), RacePath("cloud", cloud))
+    await client.get_data()
+    await client.get_data()
+    assert client.leader.name == "host"
+
+    local.error = ConnectionError("down")
+    assert (await client.get_data()).source == "cloud"
+    assert client.leader is None
+
+
+async def test_path_backing_off_is_skipped():
+    """Test a path whose host is backing off is left out of the race."""
+    local = _FakeClient(0.0, error=ConnectionError("down"))
+    cloud = _FakeClient(0.01, SimpleNamespace(source="cloud"))
+    policy = RetryPolicy(base_delay=60, max_delay=60)
+    client = RacingClient(
+        [RacePath("host", local, retry_policy=policy), RacePath("cloud", cloud)],
+        settle_lead=10,
+        probe_every=10,
+        clock=lambda: 0.0,
+    )
+
+    await client.get_data()
+    assert not policy.allow_request(0.0)
+    # The cloud answers are never counted against the host circuit
+    assert (await client.get_data()).source == "cloud"
+    assert local.calls == 1
+    assert policy.failures == 1
@@ -0,0 +1,44 @@
+"""Tests for the IRegul frame recorder and replay client."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from custom_components.integration_iregul.replay import FrameRecorder, ReplayClient
+
+from .benchmarks.frames import START, synthetic_frame
+
+
+def _record(path, count: int) -> None:
+    """Record count frames received one minute apart."""
+    recorder = FrameRecorder(str(path))
+    for offset in range(count):
+        recorder.write(synthetic_frame(40, offset=offset), START + timedelta(minutes=offset))
+
+
+async def test_replay_returns_recorded_frames(tmp_path):
+    """Test recorded frames are replayed unchanged, in order."""
+    path = tmp_path / "frames.jsonl.gz"
+    _record(path, 2)
+
+    client = ReplayClient(path)
+    assert await client.check_auth()
+    assert await client.get_data() == synthetic_frame(40, offset=0)
+    assert await client.get_data() == synthetic_frame(40, offset=1)
+    # The last frame is served again once the recording is exhausted
+    assert await client.get_data() == synthetic_frame(40, offset=1)
+
+
+async def test_replay_follows_recording_pace(tmp_path):
+    """Test an accelerated replay serves the frame current at each point in time."""
+    path = tmp_path / "frames.jsonl.gz"
+    _record(path, 3)
+
+    now = 100.0
+    client = ReplayClient(path, speed=60, clock=lambda: now)
+    first = await client.get_data()
+    now = 100.5
+    assert await client.get_data() is first
+    # Two recorded minutes elapse in two seconds at 60 times the speed
+    now = 102.0
+    assert (await client.get_data()).timestamp == synthetic_frame(40, offset=2).timestamp
@@ -0,0 +1,47 @@
+"""Tests for the IRegul fleet refresh scheduler."""
+
+from __future__ import annotations
+
+from custom_components.integration_iregul.scheduler import IRegulRefreshScheduler
+
+
+def test_devices_are_spread_evenly():
+    """Test devices sharing an interval get evenly spaced refresh slots."""
+    scheduler = IRegulRefreshScheduler()
+    device_ids = [f"SN{index:06d}" for index in range(4)]
+    for device_id in device_ids:
+        scheduler.async_register(device_id, 300.0)
+
+    slots = sorted(scheduler.next_refresh(device_id, 1000.0) % 300.0 for device_id in device_ids)
+    assert slots == [0.0, 75.0, 150.0, 225.0]
+
+    for device_id in device_ids:
+        scheduler.async_record_refresh(device_id, scheduler.next_refresh(device_id, 1000.0))
+    report = scheduler.report()["intervals"][0]
+    assert report["devices"] == 4
+    assert report["observed_spread_ratio"] == 1.0
+
+
+def test_next_refresh_is_deterministic_and_skips_close_slots():
+    """Test slots do not depend on registration order and are never too close."""
+    first = IRegulRefreshScheduler()
+    second = IRegulRefreshScheduler()
+    for device_id in ("SN1", "SN2", "SN3"):
+        first.async_register(device_id, 300.0)
+    for device_id in ("SN3", "SN1", "SN2"):
+        second.async_register(device_id, 300.0)
+
+    for device_id in ("SN1", "SN2", "SN3"):
+        slot = first.next_refresh(device_id, 1000.0)
+        assert slot == second.next_refresh(device_id, 1000.0)
+        assert 1000.0 + 300.0 * 0.25 <= slot <= 1000.0 + 300.0 * 1.25
+
+
+def test_unregister_rebalances_phases():
+    """Test removing a device spreads the remaining ones again."""
+    scheduler = IRegulRefreshScheduler()
+    scheduler.async_register("SN1", 300.0)
+    unregister = scheduler.async_register("SN2", 300.0)
+    unregister()
+
+    assert scheduler.next_refresh("SN1", 0.0) % 300.0 == 0.0
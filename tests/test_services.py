@@ -0,0 +1,67 @@
+"""Tests for the IRegul services."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from custom_components.integration_iregul.const import (
+    API_VERSION_V2,
+    CONF_API_VERSION,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_PASSWORD,
+    DOMAIN,
+)
+from custom_components.integration_iregul.profiler import RefreshProfiler
+from custom_components.integration_iregul.services import SERVICE_PROFILE
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .conftest import build_frame
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.usefixtures("enable_custom_integrations"),
+]
+
+
+async def test_profile_service_profiles_next_refreshes(hass):
+    """Test the profile service covers the requested cycles, then writes the profile."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="IRegul",
+        data={
+            CONF_API_VERSION: API_VERSION_V2,
+            CONF_DEVICE_ID: "SN123456",
+            CONF_DEVICE_PASSWORD: "secret",
+        },
+    )
+    entry.add_to_hass(hass)
+
+    with (
+        patch(
+            "custom_components.integration_iregul.coordinator.IRegulClient.get_data",
+            AsyncMock(side_effect=[build_frame(0), build_frame(60), build_frame(120)]),
+        ),
+        patch.object(RefreshProfiler, "dump") as dump,
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator = entry.runtime_data
+
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE,
+            {"config_entry_id": entry.entry_id, "cycles": 2},
+            blocking=True,
+            return_response=True,
+        )
+        assert response["path"].endswith(".prof")
+        assert coordinator.profiling
+
+        await coordinator.async_refresh()
+        assert coordinator.profiling
+        dump.assert_not_called()
+
+        await coordinator.async_refresh()
+        assert not coordinator.profiling
+        dump.assert_called_once()
@@ -0,0 +1,74 @@
+"""Tests for the IRegul single-flight client."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from custom_components.integration_iregul.singleflight import SingleFlightClient
+
+
+class _SlowClient:
+    """Client answering once released."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.fetches = 0
+        self.cancelled = 0
+
+    async def get_data(self):
+        self.fetches += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return SimpleNamespace(fetch=self.fetches)
+
+    async def check_auth(self) -> bool:
+        return True
+
+    async def defrost(self) -> bool:
+        return True
+
+
+async def test_concurrent_callers_share_one_fetch():
+    """Test concurrent calls wait for the same request and recent frames are reused."""
+    now = 0.0
+    wrapped = _SlowClient()
+    client = SingleFlightClient(wrapped, min_gap=2.0, clock=lambda: now)
+
+    callers = [asyncio.create_task(client.get_data()) for _ in range(3)]
+    await asyncio.sleep(0)
+    wrapped.release.set()
+    frames = await asyncio.gather(*callers)
+
+    assert wrapped.fetches == 1
+    assert frames[0] is frames[1] is frames[2]
+
+    # Within the gap the frame is shared, afterwards a new fetch is made
+    now = 1.0
+    assert await client.get_data() is frames[0]
+    now = 3.0
+    assert (await client.get_data()).fetch == 2
+    assert client.as_dict() == {"requests": 2, "shared_calls": 3}
+
+
+async def test_request_is_cancelled_with_its_last_caller():
+    """Test a cancelled caller leaves the shared request to the others."""
+    wrapped = _SlowClient()
+    client = SingleFlightClient(wrapped, min_gap=0)
+
+    first = asyncio.create_task(client.get_data())
+    second = asyncio.create_task(client.get_data())
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    assert wrapped.cancelled == 0
+
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    await asyncio.sleep(0)
+    assert wrapped.cancelled == 1
@@ -0,0 +1,41 @@
+"""Tests for the IRegul coordinator statistics."""
+
+from __future__ import annotations
+
+from custom_components.integration_iregul.stats import LatencyHistogram, RollingWindow
+
+
+def test_latency_histogram_percentiles():
+    """Test percentiles use bucket bounds capped by the largest latency."""
+    histogram = LatencyHistogram(buckets=(0.1, 1.0, 10.0))
+    assert histogram.percentile(0.5) is None
+
+    for latency in (0.05, 0.08, 0.5, 0.7, 0.9, 4.0):
+        histogram.record(latency)
+    histogram.record_timeout()
+
+    assert histogram.percentile(0.3) == 0.1
+    assert histogram.percentile(0.5) == 1.0
+    assert histogram.percentile(0.95) == 4.0
+    assert histogram.last == 4.0
+
+    histogram.record(25.0)
+    stats = histogram.as_dict()
+    assert stats["p99"] == 25.0
+    assert stats["timeouts"] == 1
+    assert stats["buckets"] == {"le_0.1": 2, "le_1": 3, "le_10": 1, "le_inf": 1}
+
+
+def test_rolling_window_keeps_recent_samples():
+    """Test the window drops its oldest samples and computes recent statistics."""
+    window = RollingWindow(size=4)
+    assert window.last is None
+    assert window.mean() is None
+
+    for value in (100, 1, 2, 3, 4):
+        window.add(value)
+
+    assert window.last == 4
+    assert window.mean() == 2.5
+    assert window.percentile(0.5) == 2
+    assert window.percentile(0.95) == 4